@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark of alias generation over every name the five checked-in
+datasources feed into it, against the previous list-based implementation.
+
+The previous implementation is kept below as the parity reference: for every
+name both must produce the same aliases, and the status maps built from them
+must be identical.
+
+Run from audit_project_lifecycle_across_tools/:
+
+    python benchmarks/bench_aliases.py
+"""
+import os
+import re
+import sys
+import time
+import unicodedata
+from typing import Any, Callable, Dict, List, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+
+import audit_landscape_status as audit  # noqa: E402
+
+REPEAT = 5
+
+
+# --- Reference implementation (list-based, recompiles patterns per call) ---
+
+def legacy_normalize_key(name: str) -> str:
+    text = (name or "").replace("³", "3")
+    nfkd = unicodedata.normalize("NFKD", text)
+    s = "".join(ch for ch in nfkd if not unicodedata.combining(ch)).lower().strip()
+    s = s.replace("_", " ")
+    return " ".join(s.split())
+
+
+def legacy_generate_aliases(name: str, extra: Any) -> List[str]:
+    aliases: List[str] = []
+    base = legacy_normalize_key(name)
+    if not base:
+        return []
+    aliases.append(base)
+    no_paren = legacy_normalize_key(re.sub(r"\s*\([^)]*\)", "", name).strip())
+    if no_paren and no_paren not in aliases:
+        aliases.append(no_paren)
+    for part in re.findall(r"\(([^)]*)\)", name):
+        for t in part.replace("/", " ").replace("-", " ").split():
+            t = legacy_normalize_key(t)
+            if t and t not in aliases:
+                aliases.append(t)
+    for candidate in list(aliases):
+        outs = {candidate}
+        for suf in audit.COMMON_SUFFIXES:
+            if candidate.endswith(suf):
+                outs.add(candidate[: -len(suf)].strip())
+        for trimmed in list(outs):
+            if trimmed and trimmed not in aliases:
+                aliases.append(trimmed)
+            with_proj = f"{trimmed} project".strip()
+            if with_proj and with_proj not in aliases:
+                aliases.append(with_proj)
+    for candidate in list(aliases):
+        if not candidate:
+            continue
+        for v in list({candidate, " ".join(candidate.replace("-", " ").split()), candidate.replace(" ", "-")}):
+            if v and v not in aliases:
+                aliases.append(v)
+    for candidate in list(aliases):
+        for p in re.split(r"\s*(?:/|,|&| and )\s*", candidate):
+            p = p.strip()
+            if p and p not in aliases:
+                aliases.append(p)
+    for candidate in list(aliases):
+        compact = "".join(ch for ch in candidate if ch.isalnum())
+        if compact and compact not in aliases:
+            aliases.append(compact)
+    for candidate in list(aliases):
+        camel = legacy_normalize_key(re.sub(r"(?<=[a-z0-9])(?=[A-Z])", " ", candidate))
+        if camel and camel not in aliases:
+            aliases.append(camel)
+    if isinstance(extra, dict):
+        lfx_slug = legacy_normalize_key((extra.get("lfx_slug") or ""))
+        if lfx_slug and lfx_slug not in aliases:
+            aliases.append(lfx_slug)
+    return aliases
+
+
+# --- Harness ---
+
+def build_all_maps() -> Dict[str, Dict[str, str]]:
+    sources = audit.registered_sources()
+    fetched = audit.fetch_datasources(sources, audit.MODE_OFFLINE)
+    return {src.name: src.build_map(fetched[src.name].text) for src in sources}
+
+
+def collect_calls() -> Tuple[List[Tuple[str, str]], Dict[str, Dict[str, str]]]:
+    """
+    Record every (name, lfx_slug) passed to the alias generator while building all maps.
+    """
+    calls: List[Tuple[str, str]] = []
+    real = audit.generate_aliases_from_landscape
+
+    def recording(name: str, lfx_slug: str = "") -> Tuple[str, ...]:
+        calls.append((name, lfx_slug))
+        return real(name, lfx_slug)
+
+    audit.generate_aliases_from_landscape = recording
+    try:
+        maps = build_all_maps()
+    finally:
+        audit.generate_aliases_from_landscape = real
+    return calls, maps
+
+
+def best_of(fn: Callable[[], Any]) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    calls, maps = collect_calls()
+    distinct = sorted(set(calls))
+    print(f"{len(calls)} alias generations over {len(distinct)} distinct names")
+
+    failed = False
+    for name, slug in distinct:
+        new = audit.generate_aliases_from_landscape(name, slug)
+        old = legacy_generate_aliases(name, {"lfx_slug": slug})
+        if len(new) != len(set(new)) or set(new) != set(old):
+            print(f"MISMATCH for {name!r}: {sorted(set(new) ^ set(old))}", file=sys.stderr)
+            failed = True
+
+    def run_legacy() -> None:
+        for name, slug in calls:
+            legacy_generate_aliases(name, {"lfx_slug": slug})
+
+    def run_cold() -> None:
+        audit.generate_aliases_from_landscape.cache_clear()
+        audit.normalize_key.cache_clear()
+        for name, slug in calls:
+            audit.generate_aliases_from_landscape(name, slug)
+
+    def run_warm() -> None:
+        for name, slug in calls:
+            audit.generate_aliases_from_landscape(name, slug)
+
+    print(f"{'legacy':<16} {best_of(run_legacy):8.4f}s")
+    print(f"{'ordered-set cold':<16} {best_of(run_cold):8.4f}s")
+    print(f"{'ordered-set warm':<16} {best_of(run_warm):8.4f}s")
+
+    # Status maps built through the legacy generator must match the current ones
+    real = audit.generate_aliases_from_landscape
+    audit.generate_aliases_from_landscape = lambda name, lfx_slug="": legacy_generate_aliases(
+        name, {"lfx_slug": lfx_slug}
+    )
+    try:
+        legacy_maps = build_all_maps()
+    finally:
+        audit.generate_aliases_from_landscape = real
+    for source, status_map in maps.items():
+        if status_map != legacy_maps[source]:
+            print(f"MISMATCH: {source} status map differs from the legacy build", file=sys.stderr)
+            failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
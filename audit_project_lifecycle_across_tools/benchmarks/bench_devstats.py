@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Compare DevStats parser backends on the recorded devstats.html snapshot
+against the previous implementation, which scanned each row at least twice.
+Exits non-zero if any backend builds a different status map.
+
+Expect html.parser to time about the same as the previous parser, since both
+spend most of their time building the BeautifulSoup tree; only lxml is faster.
+
+Run from audit_project_lifecycle_across_tools/:
+
+    python benchmarks/bench_devstats.py
+"""
+import os
+import sys
+import time
+from typing import Any, Callable, Dict
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+
+from bs4 import BeautifulSoup  # type: ignore  # noqa: E402
+
+import audit_landscape_status as audit  # noqa: E402
+
+REPEAT = 5
+
+
+def legacy_build_devstats_status_map(html: str) -> Dict[str, str]:
+    soup = BeautifulSoup(html, "html.parser")
+    name_to_status: Dict[str, str] = {}
+    valid_statuses = {"graduated", "incubating", "sandbox", "archived"}
+    status_markers = {"Graduated", "Incubating", "Sandbox", "Archived"}
+
+    def row_status(tr: Any) -> str:
+        for c in tr.find_all(["th", "td"]):
+            text = (c.get_text() or "").strip()
+            if text in status_markers:
+                return audit.normalize_status(text)
+        return ""
+
+    all_rows = soup.find_all("tr")
+    i = 0
+    while i < len(all_rows):
+        current_status = row_status(all_rows[i])
+        if current_status and current_status in valid_statuses:
+            i += 1
+            while i < len(all_rows):
+                nxt = all_rows[i]
+                nxt_status = row_status(nxt)
+                if nxt_status and nxt_status in valid_statuses:
+                    break
+                for a in nxt.find_all("a"):
+                    name = (a.get_text() or "").strip()
+                    if not name:
+                        continue
+                    for key in audit.generate_aliases_from_landscape(name):
+                        if key and key not in name_to_status:
+                            name_to_status[key] = current_status
+                i += 1
+            continue
+        i += 1
+    return name_to_status
+
+
+def best_of(fn: Callable[[], Any]) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    # Restores the snapshot from datasources/store/ in a fresh clone
+    html = audit.fetch_datasources([audit.SOURCE_REGISTRY["devstats"]], audit.MODE_OFFLINE)["devstats"].text
+
+    expected = legacy_build_devstats_status_map(html)
+    candidates: Dict[str, Callable[[], Dict[str, str]]] = {
+        "legacy": lambda: legacy_build_devstats_status_map(html),
+        "html.parser": lambda: audit.build_devstats_status_map(html, backend="html.parser"),
+    }
+    if audit.lxml_html is not None:
+        candidates["lxml"] = lambda: audit.build_devstats_status_map(html, backend="lxml")
+    else:
+        print("lxml not installed; skipping the lxml backend")
+
+    failed = False
+    for label, fn in candidates.items():
+        if list(fn().items()) != list(expected.items()):
+            print(f"MISMATCH: {label} backend differs from the legacy parser", file=sys.stderr)
+            failed = True
+        print(f"{label:<12} {best_of(fn):8.4f}s")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Compare the streaming landscape.yml extractor with a full document load on the
+checked-in snapshot, with the pure-Python and the libyaml loader. The audit
+streams only when libyaml is installed; tests/test_landscape_stream.py checks
+that both paths build the same status map.
+
+Run from audit_project_lifecycle_across_tools/:
+
+    python benchmarks/bench_landscape_stream.py
+"""
+import os
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+
+import yaml  # type: ignore  # noqa: E402
+
+import audit_landscape_status as audit  # noqa: E402
+import landscape_stream  # noqa: E402
+
+REPEAT = 3
+
+
+def measure(fn: Callable[[], Any]) -> Tuple[Any, float, int]:
+    """
+    Return (result, best wall time in seconds, peak traced memory in bytes).
+    """
+    best = float("inf")
+    result = None
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, best, peak
+
+
+def main() -> None:
+    # Restores the snapshot from datasources/store/ in a fresh clone
+    text = audit.fetch_datasources([audit.SOURCE_REGISTRY["landscape"]], audit.MODE_OFFLINE)["landscape"].text
+
+    loaders: Dict[str, Any] = {"python": yaml.SafeLoader}
+    if hasattr(yaml, "CSafeLoader"):
+        loaders["libyaml"] = yaml.CSafeLoader
+
+    print(f"{'loader':<8} {'mode':<7} {'seconds':>8} {'peak MiB':>9}")
+    for label, loader in loaders.items():
+        landscape_stream.YAML_LOADER = loader
+        _, full_s, full_peak = measure(
+            lambda: audit.build_landscape_status_map(yaml.load(text, Loader=loader))
+        )
+        _, stream_s, stream_peak = measure(
+            lambda: audit.build_landscape_status_map_from_items(landscape_stream.iter_landscape_items(text))
+        )
+        print(f"{label:<8} {'full':<7} {full_s:>8.3f} {full_peak / 2**20:>9.1f}")
+        print(f"{label:<8} {'stream':<7} {stream_s:>8.3f} {stream_peak / 2**20:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
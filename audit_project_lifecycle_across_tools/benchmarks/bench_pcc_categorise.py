@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Compare the single-pass PCC categorisation in fetch_pcc_projects.py with the
+previous three-lists-then-regroup implementation on a synthetic catalogue.
+Exits non-zero if the generated YAML differs.
+
+Run from audit_project_lifecycle_across_tools/:
+
+    python benchmarks/bench_pcc_categorise.py [--projects 50000]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+
+import yaml  # type: ignore  # noqa: E402
+
+import fetch_pcc_projects as fetch  # noqa: E402
+
+REPEAT = 5
+FOUNDATIONS = [fetch.FOUNDATION_ID_CNCF, "foundation-b", "foundation-c"]
+CATEGORIES = ["Graduated", "Incubating", "Sandbox", "TAG", None, "Other"]
+STATUSES = ["Active"] * 6 + ["Formation - Exploratory", "Archived", "Prospect"]
+WORDS = ["kube", "Open", "cloud", "Meta", "flux", "Mesh", "Ops", "Store", "Trace", "Guard"]
+
+
+def synthetic_catalogue(n: int, seed: int = 1) -> List[Dict[str, Any]]:
+    rnd = random.Random(seed)
+    items = []
+    for i in range(n):
+        # Names repeat (in different case) so stable tie-ordering is exercised
+        name = f"{rnd.choice(WORDS)}{rnd.choice(WORDS)} {rnd.randrange(n // 4 or 1)}"
+        items.append(
+            {
+                "ID": f"p{i:07d}",
+                "Name": name if rnd.random() > 0.5 else name.upper(),
+                "Slug": f"slug-{i}",
+                "Category": rnd.choice(CATEGORIES),
+                "Status": rnd.choice(STATUSES),
+                "ProjectLogo": f"https://logos.example/{i}.svg",
+                "RepositoryURL": f"https://github.com/org{i % 97}/repo{i}",
+                "Foundation": {"ID": rnd.choice(FOUNDATIONS)},
+            }
+        )
+    return items
+
+
+def legacy_output(items: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def category_rank(category: Any) -> int:
+        return {"TAG": 1, "Graduated": 2, "Incubating": 3, "Sandbox": 4}.get(category, 99)
+
+    active_records: List[Dict[str, Any]] = []
+    forming_records: List[Dict[str, Any]] = []
+    archived_records: List[Dict[str, Any]] = []
+    for p in items:
+        try:
+            if (p.get("Foundation") or {}).get("ID") != fetch.FOUNDATION_ID_CNCF:
+                continue
+            status = p.get("Status")
+            if status == "Active":
+                active_records.append(
+                    {
+                        "name": p.get("Name"),
+                        "slug": p.get("Slug"),
+                        "category": p.get("Category"),
+                        "status": p.get("Status"),
+                        "project_logo": p.get("ProjectLogo"),
+                        "repository_url": p.get("RepositoryURL"),
+                    }
+                )
+            elif status == "Formation - Exploratory":
+                forming_records.append(
+                    {
+                        "name": p.get("Name"),
+                        "status": p.get("Status"),
+                        "project_logo": p.get("ProjectLogo"),
+                        "repository_url": p.get("RepositoryURL"),
+                    }
+                )
+            else:
+                archived_records.append(
+                    {
+                        "name": p.get("Name"),
+                        "status": p.get("Status"),
+                        "category": p.get("Category"),
+                        "project_logo": p.get("ProjectLogo"),
+                        "repository_url": p.get("RepositoryURL"),
+                    }
+                )
+        except Exception:
+            continue
+
+    active_records.sort(key=lambda r: (category_rank(r.get("category")), (r.get("name") or "").lower()))
+    forming_records.sort(key=lambda r: (r.get("name") or "").lower())
+    archived_records.sort(key=lambda r: (r.get("name") or "").lower())
+    categories: Dict[str, List[Dict[str, Any]]] = {k: [] for k in ["Graduated", "Incubating", "Sandbox"]}
+    for rec in active_records:
+        if rec.get("category") in categories:
+            categories[rec["category"]].append(rec)
+    return {
+        "source": "LFX PCC project-service",
+        "foundation_id": fetch.FOUNDATION_ID_CNCF,
+        "categories": categories,
+        "forming_projects": forming_records,
+        "archived_projects": archived_records,
+    }
+
+
+def current_output(items: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return fetch.build_output(fetch.categorise(items))
+
+
+def measure(fn: Callable[[], Any]) -> Tuple[Any, float, int]:
+    """
+    Return (result, best wall time in seconds, peak traced memory in bytes).
+    """
+    best = float("inf")
+    result = None
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, best, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--projects", type=int, default=50000, help="Size of the synthetic catalogue")
+    args = parser.parse_args()
+
+    items = synthetic_catalogue(args.projects)
+    legacy, legacy_s, legacy_peak = measure(lambda: legacy_output(items))
+    current, current_s, current_peak = measure(lambda: current_output(items))
+    print(f"{args.projects} projects")
+    print(f"{'legacy':<8} {legacy_s:8.4f}s {legacy_peak / 2**20:7.1f} MiB peak")
+    print(f"{'current':<8} {current_s:8.4f}s {current_peak / 2**20:7.1f} MiB peak")
+
+    dump = lambda o: yaml.safe_dump(o, sort_keys=False, allow_unicode=True)  # noqa: E731
+    if dump(legacy) != dump(current):
+        print("MISMATCH: categorised YAML differs from the legacy implementation", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
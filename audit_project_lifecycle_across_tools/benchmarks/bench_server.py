@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Load-test the audit query server (scripts/audit_server.py) locally.
+
+Starts the server in-process on a free port over the checked-in datasources/
+snapshot. Then many client threads, each with one keep-alive connection,
+query every PCC project, every source and a few unknown names concurrently.
+Prints the request latency percentiles and throughput. It also checks that a
+conditional request is answered 304, and that /reload swaps in a new index
+whose responses match the old ones.
+
+Run from audit_project_lifecycle_across_tools/:
+
+    python benchmarks/bench_server.py [--clients N] [--rounds N]
+"""
+import argparse
+import http.client
+import json
+import os
+import sys
+import threading
+import time
+from typing import List, Tuple
+from urllib.parse import quote
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+
+import audit_server  # noqa: E402
+from profiling import percentile  # noqa: E402
+
+DEFAULT_CLIENTS = 16
+DEFAULT_ROUNDS = 5
+UNKNOWN_NAMES = ("kubernetes-sigs", "opentelemetry collector", "not-a-project-at-all")
+
+
+def request(conn: http.client.HTTPConnection, method: str, path: str, headers: dict = {}) -> Tuple[int, bytes, str]:
+    conn.request(method, path, headers=headers)
+    response = conn.getresponse()
+    return response.status, response.read(), response.getheader("ETag", "")
+
+
+def query_paths(port: int) -> List[str]:
+    conn = http.client.HTTPConnection("127.0.0.1", port)
+    status, body, _ = request(conn, "GET", "/projects")
+    assert status == 200, status
+    paths = [f"/projects/{quote(p['project'], safe='')}" for p in json.loads(body)]
+    status, body, _ = request(conn, "GET", "/sources")
+    paths += [f"/sources/{s['name']}" for s in json.loads(body)]
+    paths += [f"/projects/{quote(name, safe='')}" for name in UNKNOWN_NAMES]
+    paths += ["/projects?anomaly=true", "/projects?status=sandbox", "/health"]
+    conn.close()
+    return paths
+
+
+def client(port: int, paths: List[str], rounds: int, offset: int, latencies: List[float]) -> None:
+    conn = http.client.HTTPConnection("127.0.0.1", port)
+    own: List[float] = []
+    for _ in range(rounds):
+        # Each client walks the paths from a different offset, so they do not move in lockstep
+        for i in range(len(paths)):
+            path = paths[(i + offset) % len(paths)]
+            start = time.perf_counter()
+            status, _, _ = request(conn, "GET", path)
+            own.append(time.perf_counter() - start)
+            assert status in (200, 404), (path, status)
+    conn.close()
+    latencies.extend(own)
+
+
+def check_conditional_and_reload(port: int, paths: List[str]) -> None:
+    conn = http.client.HTTPConnection("127.0.0.1", port)
+    before = {path: request(conn, "GET", path) for path in paths if not path.startswith("/health")}
+    path = paths[0]
+    status, _, _ = request(conn, "GET", path, {"If-None-Match": before[path][2]})
+    assert status == 304, f"expected 304 for a matching ETag, got {status}"
+    status, body, _ = request(conn, "POST", "/reload")
+    assert status == 200 and json.loads(body)["generation"] == 2, (status, body)
+    after = {path: request(conn, "GET", path) for path in before}
+    assert after == before, "responses changed across a reload of the same snapshot"
+    conn.close()
+    print(f"ETag 304 and reload parity: ok ({len(before)} responses compared)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--clients", type=int, default=DEFAULT_CLIENTS)
+    parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS)
+    args = parser.parse_args()
+
+    service = audit_server.AuditService([], audit_server.audit.PARSE_CACHE_DIR, True, audit_server.audit.FUZZY_MIN_SCORE)
+    server = audit_server.make_server(service, "127.0.0.1", 0)
+    port = server.server_address[1]
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        paths = query_paths(port)
+        # Warm the response cache, as a long-running server would be
+        client(port, paths, 1, 0, [])
+        latencies: List[float] = []
+        threads = [
+            threading.Thread(target=client, args=(port, paths, args.rounds, i * 7, latencies))
+            for i in range(args.clients)
+        ]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+        ordered = sorted(latencies)
+        print(
+            f"{len(ordered)} requests from {args.clients} clients in {elapsed:.2f}s "
+            f"({len(ordered) / elapsed:.0f} req/s)"
+        )
+        print("latency " + ", ".join(
+            f"p{pct}={percentile(ordered, pct) * 1000:.3f}ms" for pct in (50, 90, 99)
+        ) + f", max={ordered[-1] * 1000:.3f}ms")
+        check_conditional_and_reload(port, paths)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Time every stage of the audit separately on the checked-in datasources/
+snapshot and on synthetic scale-ups of it, and write the results as JSON so
+runs can be compared.
+
+Stages: parsing each source (YAML/CSV load), building each status map, loading
+the PCC YAML, collect_pcc_expected_statuses, resolving every PCC project
+against the maps (what main() does), the fuzzy fallback for unresolved
+sources (index build included), classifying the rows into anomalies and
+status groups, and both markdown writers. Alias caches
+are cleared before every timed run, so each run is a cold start.
+
+Run from audit_project_lifecycle_across_tools/:
+
+    python benchmarks/bench_stages.py [--scenario NAME ...] [--output FILE] [--compare OLD.json]
+
+With --compare, stages slower than --threshold times the old result are
+reported and the script exits non-zero.
+"""
+import argparse
+import copy
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+
+import yaml  # type: ignore  # noqa: E402
+
+import audit_landscape_status as audit  # noqa: E402
+
+DEFAULT_REPEAT = 3
+DEFAULT_OUTPUT = os.path.join(audit.REPO_ROOT, ".cache", "benchmarks", "stages.json")
+DEFAULT_THRESHOLD = 1.25
+# Stages faster than this are too noisy to flag as regressions
+MIN_COMPARABLE_SECONDS = 0.005
+RESULTS_FORMAT = 1
+
+# Scale factor per input ("landscape" or "pcc") for each scenario
+SCENARIOS: Dict[str, Dict[str, int]] = {
+    "baseline": {},
+    "landscape_x10": {"landscape": 10},
+    "pcc_x20": {"pcc": 20},
+}
+
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def clear_alias_caches() -> None:
+    audit.normalize_key.cache_clear()
+    audit.generate_aliases_from_landscape.cache_clear()
+    audit.generate_query_keys.cache_clear()
+
+
+def best_of(fn: Callable[[], Any], repeat: int) -> Tuple[Any, float]:
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        clear_alias_caches()
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def scale_landscape(text: str, factor: int) -> str:
+    """
+    Copy every landscape item `factor - 1` times under new names, so every
+    copy yields distinct alias keys.
+    """
+    if factor <= 1:
+        return text
+    doc = yaml.load(text, Loader=audit.YAML_LOADER)
+    for category in doc.get("landscape") or []:
+        for subcategory in category.get("subcategories") or []:
+            items = subcategory.get("items") or []
+            copies = []
+            for i in range(1, factor):
+                for item in items:
+                    clone = copy.deepcopy(item)
+                    clone["name"] = f"{item.get('name')} Copy{i}"
+                    extra = clone.get("extra")
+                    if isinstance(extra, dict) and extra.get("lfx_slug"):
+                        extra["lfx_slug"] = f"{extra['lfx_slug']}-copy{i}"
+                    copies.append(clone)
+            subcategory["items"] = items + copies
+    return yaml.dump(doc, Dumper=YAML_DUMPER, sort_keys=False, allow_unicode=True)
+
+
+def scale_pcc(text: str, factor: int) -> str:
+    if factor <= 1:
+        return text
+    doc = yaml.load(text, Loader=audit.YAML_LOADER)
+
+    def scaled(records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        out = list(records)
+        for i in range(1, factor):
+            out.extend({**r, "name": f"{r.get('name')} Copy{i}"} for r in records)
+        return out
+
+    doc["categories"] = {k: scaled(v or []) for k, v in (doc.get("categories") or {}).items()}
+    doc["forming_projects"] = scaled(doc.get("forming_projects") or [])
+    doc["archived_projects"] = scaled(doc.get("archived_projects") or [])
+    return yaml.dump(doc, Dumper=YAML_DUMPER, sort_keys=False, allow_unicode=True)
+
+
+def run_scenario(scale: Dict[str, int], repeat: int, out_dir: str) -> Dict[str, Any]:
+    sources = audit.registered_sources()
+    texts = audit.fetch_datasources(sources, audit.MODE_OFFLINE)
+    source_texts = {s.name: texts[s.name].text for s in sources}
+    source_texts["landscape"] = scale_landscape(source_texts["landscape"], scale.get("landscape", 1))
+    pcc_text = scale_pcc(audit.read_pcc_text(), scale.get("pcc", 1))
+
+    stages: Dict[str, float] = {}
+    maps: Dict[str, Dict[str, str]] = {}
+    for source in sources:
+        text = source_texts[source.name]
+        parsed, stages[f"parse.{source.name}"] = best_of(lambda: source.parse(text), repeat)
+        if isinstance(parsed, Iterator):
+            # A streaming parser is lazy: its work happens while the map is built,
+            # and each run needs a fresh iterator
+            build = lambda: source.build(source.parse(text))  # noqa: E731
+        else:
+            build = lambda: source.build(parsed)  # noqa: E731
+        maps[source.name], stages[f"build.{source.name}"] = best_of(build, repeat)
+
+    pcc_data, stages["parse.pcc"] = best_of(lambda: yaml.load(pcc_text, Loader=audit.YAML_LOADER), repeat)
+    expected, stages["collect_pcc_expected_statuses"] = best_of(
+        lambda: audit.collect_pcc_expected_statuses(pcc_data), repeat
+    )
+    (rows, _, _), stages["resolve"] = best_of(lambda: audit.resolve_rows(expected, maps), repeat)
+    aliases = audit.AliasIndex.build(maps)
+    (rows, fuzzy_matches), stages["fuzzy"] = best_of(
+        lambda: audit.fuzzy_fill(rows, lambda: audit.FuzzyIndex.build(aliases, skip_prefix=audit.REPO_KEY_PREFIX)), repeat
+    )
+    classified, stages["classify"] = best_of(lambda: audit.classify_rows(rows), repeat)
+
+    target = audit.AuditTarget(
+        "bench",
+        "CNCF",
+        audit.PCC_YAML_PATH,
+        os.path.join(out_dir, "status_audit.md"),
+        os.path.join(out_dir, "all_statuses.md"),
+        os.path.join(out_dir, "audit_state.pickle"),
+    )
+    _, stages["write_audit_markdown"] = best_of(lambda: audit.write_audit_markdown(classified, sources, target), repeat)
+    _, stages["write_full_status_markdown"] = best_of(
+        lambda: audit.write_full_status_markdown(classified, sources, target), repeat
+    )
+
+    return {
+        "scale": {"landscape": scale.get("landscape", 1), "pcc": scale.get("pcc", 1)},
+        "sizes": {
+            **{f"{name}_keys": len(m) for name, m in maps.items()},
+            "pcc_projects": len(expected),
+            "fuzzy_matches": fuzzy_matches,
+            "anomalies": len(classified.anomalies),
+        },
+        "stages": stages,
+    }
+
+
+def compare(old: Dict[str, Any], new: Dict[str, Any], threshold: float) -> List[str]:
+    regressions = []
+    for scenario, result in new["scenarios"].items():
+        old_stages = (old.get("scenarios", {}).get(scenario) or {}).get("stages") or {}
+        for stage, seconds in result["stages"].items():
+            before = old_stages.get(stage)
+            if before is None or max(before, seconds) < MIN_COMPARABLE_SECONDS:
+                continue
+            if seconds > before * threshold:
+                regressions.append(f"{scenario}/{stage}: {before:.4f}s -> {seconds:.4f}s ({seconds / before:.2f}x)")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Per-stage audit benchmarks over the datasources snapshot.")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS), help="Scenario to run; repeatable (default: all)")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help=f"Runs per stage, best kept (default: {DEFAULT_REPEAT})")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="Where to write the JSON results")
+    parser.add_argument("--compare", metavar="OLD_JSON", help="Flag stages slower than in this earlier results file")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help=f"Slowdown ratio counted as a regression (default: {DEFAULT_THRESHOLD})")
+    args = parser.parse_args(argv)
+
+    results: Dict[str, Any] = {
+        "format": RESULTS_FORMAT,
+        "python": platform.python_version(),
+        "yaml_loader": audit.YAML_LOADER.__name__,
+        "devstats_backend": audit.DEVSTATS_BACKEND,
+        "repeat": args.repeat,
+        "scenarios": {},
+    }
+    with tempfile.TemporaryDirectory() as out_dir:
+        for name in args.scenario or list(SCENARIOS):
+            result = run_scenario(SCENARIOS[name], max(1, args.repeat), out_dir)
+            results["scenarios"][name] = result
+            print(f"{name}  ({', '.join(f'{k}={v}' for k, v in result['sizes'].items())})")
+            for stage, seconds in result["stages"].items():
+                print(f"  {stage:<32} {seconds:8.4f}s")
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+        f.write("\n")
+    print(f"Wrote {args.output}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            regressions = compare(json.load(f), results, args.threshold)
+        for line in regressions:
+            print(f"REGRESSION: {line}", file=sys.stderr)
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Inverted alias index shared by all audited sources.
+
+Every normalized key maps to a compact status vector with one byte per source
+(0 means the source has no entry for that key). Resolving a project is then a
+single pass over its query keys that fills every source's first match at once,
+instead of probing each source's dict separately.
+"""
+from typing import Dict, Iterable, List, Tuple
+
+
+class AliasIndex:
+    __slots__ = ("sources", "statuses", "_vectors")
+
+    def __init__(self, sources: List[str]) -> None:
+        self.sources: List[str] = list(sources)
+        # Status code table; code 0 is reserved for "missing"
+        self.statuses: List[str] = [""]
+        self._vectors: Dict[str, bytes] = {}
+
+    @classmethod
+    def build(cls, maps: Dict[str, Dict[str, str]]) -> "AliasIndex":
+        """
+        Build an index from {source name: {key: status}}; sources keep the order of `maps`.
+        """
+        index = cls(list(maps))
+        codes: Dict[str, int] = {}
+        width = len(index.sources)
+        pending: Dict[str, bytearray] = {}
+        for sid, status_map in enumerate(maps.values()):
+            for key, status in status_map.items():
+                if not status:
+                    continue
+                code = codes.get(status)
+                if code is None:
+                    code = len(index.statuses)
+                    if code > 255:
+                        raise ValueError("AliasIndex supports at most 255 distinct statuses")
+                    codes[status] = code
+                    index.statuses.append(status)
+                vec = pending.get(key)
+                if vec is None:
+                    vec = pending[key] = bytearray(width)
+                vec[sid] = code
+        index._vectors = {key: bytes(vec) for key, vec in pending.items()}
+        return index
+
+    def __len__(self) -> int:
+        return len(self._vectors)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._vectors
+
+    def keys(self) -> Iterable[str]:
+        return self._vectors.keys()
+
+    def vector(self, key: str) -> bytes:
+        """
+        Status codes of `key` per source, in source order; 0 where a source lacks it.
+        """
+        return self._vectors.get(key) or bytes(len(self.sources))
+
+    def status(self, key: str, source: str) -> str:
+        return self.statuses[self.vector(key)[self.sources.index(source)]]
+
+    def resolve_matches(self, query_keys: Iterable[str]) -> List[Tuple[str, str]]:
+        """
+        Return (status, matched key) per source; both are "" when the source has
+        no entry for any query key. For each source the first query key it knows
+        about wins, exactly as probing its own map in order would.
+        """
+        width = len(self.sources)
+        found = bytearray(width)
+        keys = [""] * width
+        remaining = width
+        vectors = self._vectors
+        for key in query_keys:
+            vec = vectors.get(key)
+            if vec is None:
+                continue
+            for sid in range(width):
+                if vec[sid] and not found[sid]:
+                    found[sid] = vec[sid]
+                    keys[sid] = key
+                    remaining -= 1
+            if not remaining:
+                break
+        statuses = self.statuses
+        return [(statuses[code], key) for code, key in zip(found, keys)]
@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+"""
+Local, read-only HTTP API over the resolved audit.
+
+The server loads the snapshots in datasources/ once (offline, through the
+parse cache), resolves every PCC project with the same code as
+audit_landscape_status.py and keeps the result in memory. Requests are then
+answered from that index without running the audit again:
+
+    GET  /health                         generation, load time and sizes
+    GET  /projects[?foundation=&status=&anomaly=true|false]
+                                         one summary per PCC project
+    GET  /projects/<name>[?foundation=]  what every source says about a project
+    GET  /sources                        registered sources with status counts
+    GET  /sources/<source>[?foundation=&status=]
+                                         PCC projects as that source sees them
+    POST /reload                         rebuild the index from disk
+
+Responses are JSON and carry a strong ETag computed from the body, so a caller
+sending If-None-Match gets 304 while the data is unchanged, even across
+reloads. Each index keeps the encoded responses it served, so a repeated query
+costs a dict lookup. A reload builds a new index while requests keep being
+answered from the old one, then swaps it in.
+
+Only the standard library is used (ThreadingHTTPServer, one thread per
+connection, HTTP/1.1 keep-alive). Bind it to localhost: there is no
+authentication.
+"""
+import argparse
+import hashlib
+import json
+import sys
+import threading
+import time
+from functools import lru_cache
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import audit_landscape_status as audit
+from alias_index import AliasIndex
+from fuzzy_index import FuzzyIndex
+from source_fetch import MODE_OFFLINE
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+# Encoded responses kept per index; queries past this are answered but not cached
+MAX_CACHED_RESPONSES = 4096
+
+Response = Tuple[int, bytes, str]
+
+
+def project_record(row: audit.AuditRow, sources: List[audit.Source], foundation: str) -> Dict[str, Any]:
+    """
+    A JSON Lines record (see audit_record) with the source columns grouped per source.
+    """
+    flat = audit.audit_record(row, sources, foundation)
+    record = {key: flat[key] for key in ("foundation", "project", "pcc_status", "anomaly", "reasons")}
+    record["sources"] = {
+        src.name: {
+            "status": flat[f"{src.name}_status"],
+            "key": flat[f"{src.name}_key"],
+            "confidence": flat[f"{src.name}_confidence"],
+        }
+        for src in sources
+    }
+    return record
+
+
+def encode(status: int, payload: Any) -> Response:
+    body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+    return status, body, '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+class AuditIndex:
+    """
+    Everything the API answers from, built once and never modified afterwards,
+    so request threads read it without locking.
+    """
+
+    def __init__(
+        self,
+        generation: int,
+        sources: List[audit.Source],
+        maps: Dict[str, Dict[str, str]],
+        records: Dict[str, List[Dict[str, Any]]],
+        fuzzy: bool,
+        fuzzy_min_score: float,
+        load_seconds: float,
+    ) -> None:
+        self.generation = generation
+        self.sources = sources
+        self.maps = maps
+        # Records per foundation, in report order
+        self.records = records
+        self.fuzzy_min_score = fuzzy_min_score
+        self.loaded_at = time.time()
+        self.load_seconds = load_seconds
+        self.by_name: Dict[str, List[Dict[str, Any]]] = {}
+        for foundation_records in records.values():
+            for record in foundation_records:
+                self.by_name.setdefault(audit.normalize_key(record["project"]), []).append(record)
+        self.alias_index = lru_cache(maxsize=1)(lambda: AliasIndex.build(maps))
+        self.fuzzy_index = lru_cache(maxsize=1)(
+            lambda: FuzzyIndex.build(self.alias_index(), skip_prefix=audit.REPO_KEY_PREFIX)
+        ) if fuzzy else None
+        self._responses: Dict[str, Response] = {}
+
+    @classmethod
+    def load(
+        cls,
+        foundations: List[str],
+        cache_dir: Optional[str],
+        fuzzy: bool = True,
+        fuzzy_min_score: float = audit.FUZZY_MIN_SCORE,
+        generation: int = 1,
+    ) -> "AuditIndex":
+        """
+        Resolve every target from the snapshots on disk, as an offline audit
+        run would, without writing any report or the sources manifest. Raises
+        FileNotFoundError when a snapshot is missing.
+        """
+        start = time.perf_counter()
+        targets = [audit.foundation_target(name) for name in foundations] or [audit.default_target()]
+        pcc_texts = {target.name: audit.read_pcc_text(target.pcc_path) for target in targets}
+        sources = audit.registered_sources()
+        fetched = audit.fetch_datasources(sources, MODE_OFFLINE)
+        maps = audit.build_status_maps(sources, fetched, cache_dir)
+        source_shas = {source.name: fetched[source.name].sha256 for source in sources}
+        shared_index = lru_cache(maxsize=1)(lambda: AliasIndex.build(maps))
+        shared_fuzzy = lru_cache(maxsize=1)(
+            lambda: FuzzyIndex.build(shared_index(), skip_prefix=audit.REPO_KEY_PREFIX)
+        ) if fuzzy else None
+        records: Dict[str, List[Dict[str, Any]]] = {}
+        for target in targets:
+            classified, _ = audit.build_audit(
+                target, pcc_texts[target.name], sources, maps, source_shas, cache_dir,
+                index_factory=shared_index, fuzzy_factory=shared_fuzzy, fuzzy_min_score=fuzzy_min_score,
+            )
+            foundation = target.title.lower()
+            records[foundation] = [project_record(row, sources, foundation) for row in classified.rows]
+        return cls(generation, sources, maps, records, fuzzy, fuzzy_min_score, time.perf_counter() - start)
+
+    def respond(self, path: str, query: str) -> Response:
+        cache_key = f"{path}?{query}"
+        response = self._responses.get(cache_key)
+        if response is None:
+            response = self._route(path, parse_qs(query))
+            if len(self._responses) < MAX_CACHED_RESPONSES:
+                self._responses[cache_key] = response
+        return response
+
+    def health(self) -> Dict[str, Any]:
+        return {
+            "generation": self.generation,
+            "loaded_at": self.loaded_at,
+            "load_seconds": round(self.load_seconds, 3),
+            "foundations": {foundation: len(records) for foundation, records in self.records.items()},
+            "sources": {source.name: len(self.maps[source.name]) for source in self.sources},
+        }
+
+    def _route(self, path: str, params: Dict[str, List[str]]) -> Response:
+        # Split before unquoting, so a name may contain an escaped "/"
+        parts = [unquote(part) for part in path.split("/") if part]
+        foundation = params.get("foundation", [""])[0].lower()
+        if foundation and foundation not in self.records:
+            return encode(HTTPStatus.NOT_FOUND, {"error": f"unknown foundation {foundation!r}"})
+        if parts == ["health"]:
+            return encode(HTTPStatus.OK, self.health())
+        if parts == ["projects"]:
+            return encode(HTTPStatus.OK, self._projects(foundation, params))
+        if len(parts) == 2 and parts[0] == "projects":
+            return self._project(parts[1], foundation)
+        if parts == ["sources"]:
+            return encode(HTTPStatus.OK, self._sources())
+        if len(parts) == 2 and parts[0] == "sources":
+            return self._source(parts[1], foundation, params.get("status", [""])[0].lower())
+        return encode(HTTPStatus.NOT_FOUND, {"error": f"no such endpoint: {path}"})
+
+    def _selected(self, foundation: str) -> List[Dict[str, Any]]:
+        if foundation:
+            return self.records[foundation]
+        return [record for records in self.records.values() for record in records]
+
+    def _projects(self, foundation: str, params: Dict[str, List[str]]) -> List[Dict[str, Any]]:
+        status = params.get("status", [""])[0].lower()
+        anomaly = params.get("anomaly", [""])[0].lower()
+        return [
+            {key: record[key] for key in ("foundation", "project", "pcc_status", "anomaly")}
+            for record in self._selected(foundation)
+            if (not status or record["pcc_status"] == status)
+            and (not anomaly or record["anomaly"] == (anomaly in ("1", "true", "yes")))
+        ]
+
+    def _project(self, name: str, foundation: str) -> Response:
+        matches = [
+            record for record in self.by_name.get(audit.normalize_key(name), ())
+            if not foundation or record["foundation"] == foundation
+        ]
+        if matches:
+            return encode(HTTPStatus.OK, {"query": name, "pcc": True, "results": matches})
+        # Not a PCC project: report what each source says about the name itself
+        resolved = audit.resolve_project(name, self.alias_index())
+        row = audit.AuditRow(name, "", resolved.statuses, resolved.matched, {}, 0, ())
+        if self.fuzzy_index is not None:
+            row = audit.fuzzy_fill([row], self.fuzzy_index, self.fuzzy_min_score)[0][0]
+        if not any(row.statuses.values()):
+            return encode(HTTPStatus.NOT_FOUND, {"query": name, "error": "no PCC project or source alias matches"})
+        sources = project_record(row, self.sources, foundation)["sources"]
+        return encode(HTTPStatus.OK, {"query": name, "pcc": False, "results": [{"project": name, "sources": sources}]})
+
+    def _sources(self) -> List[Dict[str, Any]]:
+        summary = []
+        for source in self.sources:
+            counts: Dict[str, int] = {}
+            for status in self.maps[source.name].values():
+                counts[status] = counts.get(status, 0) + 1
+            summary.append({
+                "name": source.name,
+                "label": source.label,
+                "keys": len(self.maps[source.name]),
+                "key_statuses": dict(sorted(counts.items())),
+            })
+        return summary
+
+    def _source(self, name: str, foundation: str, status: str) -> Response:
+        if name not in self.maps:
+            return encode(HTTPStatus.NOT_FOUND, {"error": f"unknown source {name!r}"})
+        rows = []
+        for record in self._selected(foundation):
+            seen = record["sources"][name]
+            if status and (seen["status"] or "") != status:
+                continue
+            rows.append({
+                "foundation": record["foundation"],
+                "project": record["project"],
+                "pcc_status": record["pcc_status"],
+                **seen,
+            })
+        return encode(HTTPStatus.OK, {"source": name, "projects": rows})
+
+
+class AuditService:
+    """
+    Holds the current AuditIndex and replaces it on reload. Readers take the
+    current reference without locking; reloads are serialised.
+    """
+
+    def __init__(self, foundations: List[str], cache_dir: Optional[str], fuzzy: bool, fuzzy_min_score: float) -> None:
+        self.foundations = foundations
+        self.cache_dir = cache_dir
+        self.fuzzy = fuzzy
+        self.fuzzy_min_score = fuzzy_min_score
+        self._reload_lock = threading.Lock()
+        self.index = AuditIndex.load(foundations, cache_dir, fuzzy, fuzzy_min_score)
+
+    def reload(self) -> AuditIndex:
+        with self._reload_lock:
+            self.index = AuditIndex.load(
+                self.foundations, self.cache_dir, self.fuzzy, self.fuzzy_min_score, self.index.generation + 1
+            )
+        return self.index
+
+
+class AuditRequestHandler(BaseHTTPRequestHandler):
+    # Keep-alive, so a caller reuses its connection across queries
+    protocol_version = "HTTP/1.1"
+    # Headers and body leave in one buffered write (flushed after each request),
+    # without Nagle delaying the small responses
+    wbufsize = 64 * 1024
+    disable_nagle_algorithm = True
+    server_version = "AuditServer/1"
+    service: AuditService
+    verbose = False
+
+    def do_GET(self) -> None:
+        url = urlsplit(self.path)
+        status, body, etag = self.service.index.respond(url.path, url.query)
+        if status == HTTPStatus.OK and etag in self._if_none_match():
+            self._send(HTTPStatus.NOT_MODIFIED, b"", etag)
+        else:
+            self._send(status, body, etag)
+
+    def do_HEAD(self) -> None:
+        url = urlsplit(self.path)
+        status, body, etag = self.service.index.respond(url.path, url.query)
+        self._send(status, body, etag, include_body=False)
+
+    def do_POST(self) -> None:
+        # Drain any request body so the connection can be reused
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        if urlsplit(self.path).path.rstrip("/") != "/reload":
+            self._send(*encode(HTTPStatus.NOT_FOUND, {"error": f"no such endpoint: {self.path}"}))
+            return
+        try:
+            index = self.service.reload()
+        except Exception as err:
+            # The previous index keeps serving
+            self._send(*encode(HTTPStatus.INTERNAL_SERVER_ERROR, {"error": f"reload failed: {err}"}))
+            return
+        self._send(*encode(HTTPStatus.OK, index.health()))
+
+    def _if_none_match(self) -> List[str]:
+        header = self.headers.get("If-None-Match")
+        if not header:
+            return []
+        return [tag.strip() for tag in header.split(",")]
+
+    def _send(self, status: int, body: bytes, etag: str, include_body: bool = True) -> None:
+        self.send_response(status)
+        if status != HTTPStatus.NOT_MODIFIED:
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        if include_body and status != HTTPStatus.NOT_MODIFIED:
+            self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if self.verbose:
+            super().log_message(format, *args)
+
+
+class AuditHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # The default backlog of 5 makes a burst of new connections wait for a SYN retry
+    request_queue_size = 128
+
+
+def make_server(
+    service: AuditService, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, verbose: bool = False
+) -> AuditHTTPServer:
+    handler = type("Handler", (AuditRequestHandler,), {"service": service, "verbose": verbose})
+    return AuditHTTPServer((host, port), handler)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Serve the resolved audit as a local JSON API.")
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"Address to bind (default: {DEFAULT_HOST})")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Port to bind, 0 for any (default: {DEFAULT_PORT})")
+    parser.add_argument(
+        "--foundation",
+        action="append",
+        default=[],
+        type=audit._foundation_name,
+        metavar="NAME",
+        help="Serve datasources/pcc_projects.NAME.yaml instead of the CNCF snapshot; may be repeated",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Rebuild every status map instead of using .cache/parsed/")
+    parser.add_argument("--no-fuzzy", action="store_true", help="Disable the fuzzy fallback matcher")
+    parser.add_argument(
+        "--fuzzy-threshold",
+        type=float,
+        default=audit.FUZZY_MIN_SCORE,
+        metavar="SCORE",
+        help=f"Minimum similarity (0-1) for a fuzzy match (default: {audit.FUZZY_MIN_SCORE})",
+    )
+    parser.add_argument("--verbose", action="store_true", help="Log every request on stderr")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    audit.ensure_dirs()
+    try:
+        service = AuditService(
+            list(dict.fromkeys(args.foundation)),
+            None if args.no_cache else audit.PARSE_CACHE_DIR,
+            not args.no_fuzzy,
+            args.fuzzy_threshold,
+        )
+    except FileNotFoundError as err:
+        print(f"Error: {err}", file=sys.stderr)
+        sys.exit(1)
+    server = make_server(service, args.host, args.port, args.verbose)
+    host, port = server.server_address[:2]
+    print(f"Serving the audit on http://{host}:{port}/ (loaded in {service.index.load_seconds:.2f}s)", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("Stopped", file=sys.stderr)
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,31 @@
 #!/usr/bin/env python3
+import argparse
+import calendar
 import os
+import re
 import sys
-import time
 import json
-from typing import Dict, List, Any
+import time
+from operator import attrgetter
+from typing import Callable, Dict, FrozenSet, Iterable, List, Any, NamedTuple, Optional, Tuple
 
 import requests
 
+from pcc_client import (
+    UNSUPPORTED_QUERY_STATUS_CODES,
+    PageCheckpoint,
+    TokenBucket,
+    build_session,
+    crawl_pages,
+    get_page,
+    page_count,
+    page_items,
+    probe_query,
+)
+from pcc_store import ProjectStore, project_key
+import profiling
+from report_writer import AtomicReport
+
 try:
     import yaml  # type: ignore
 except Exception:
@@ -16,10 +35,46 @@ except Exception:
 
 API_URL = "https://api-gw.platform.linuxfoundation.org/project-service/v1/projects"
 FOUNDATION_ID_CNCF = "a0941000002wBz4AAE"
+# Foundations that --foundation accepts by name alone; others are passed as NAME=ID
+KNOWN_FOUNDATIONS = {"cncf": FOUNDATION_ID_CNCF}
 PAGE_SIZE = 100
-SLEEP_BETWEEN_CALLS_SECONDS = 0.2
+# Query parameters used to push the foundation filter and field list down to the API.
+# probe_query() falls back to client-side filtering if the API does not honour them.
+FOUNDATION_FILTER_PARAM = "foundationId"
+FIELDS_PARAM = "fields"
+# Query parameter asking for projects modified at or after a timestamp, and the
+# field holding that timestamp; without them every sync is a full crawl.
+MODIFIED_SINCE_PARAM = "updatedSince"
+MODIFIED_FIELD = "UpdatedAt"
+# Raw project fields the store and the records below are built from
+PROJECT_FIELDS = (
+    "ID",
+    "Name",
+    "Slug",
+    "Category",
+    "Status",
+    "ProjectLogo",
+    "RepositoryURL",
+    MODIFIED_FIELD,
+    "Foundation",
+)
+DEFAULT_CONCURRENCY = 4
+# A modified-since sync never sees deleted projects, so a full crawl reconciles
+# the store once the last one is this many days old
+DEFAULT_FULL_EVERY_DAYS = 7.0
+TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+# Average request rate and burst allowed by the token bucket
+DEFAULT_RATE_PER_SECOND = 5.0
+DEFAULT_BURST = 4
 DATASOURCES_DIR = os.path.join(os.getcwd(), "datasources")
 OUTPUT_PATH = os.path.join(DATASOURCES_DIR, "pcc_projects.yaml")
+CHECKPOINT_DIR = os.path.join(os.getcwd(), ".cache", "pcc_pages")
+STORE_PATH = os.path.join(os.getcwd(), ".cache", "pcc_store.sqlite3")
+PROFILE_OUTPUT_PATH = os.path.join(os.getcwd(), ".cache", "profile", "fetch_pcc.json")
+# Active categories written to the YAML, in output order ("TAG" is excluded)
+CATEGORY_KEYS = ("Graduated", "Incubating", "Sandbox")
+STATUS_ACTIVE = "Active"
+STATUS_FORMING = "Formation - Exploratory"
 
 
 def get_lfx_token() -> str:
@@ -30,132 +85,457 @@ def get_lfx_token() -> str:
     return token
 
 
-def fetch_page(session: requests.Session, offset: int, limit: int) -> Dict[str, Any]:
-    params = {"offset": offset, "limit": limit}
-    response = session.get(API_URL, params=params, timeout=30)
-    response.raise_for_status()
-    return response.json()
+def slim_project(p: Any) -> Optional[Dict[str, Any]]:
+    """
+    Reduce a project to PROJECT_FIELDS while each page is decoded.
+    """
+    if not isinstance(p, dict):
+        return None
+    record = {k: p.get(k) for k in PROJECT_FIELDS}
+    record["Foundation"] = {"ID": (p.get("Foundation") or {}).get("ID")}
+    return record
 
 
-def project_to_record(p: Dict[str, Any]) -> Dict[str, Any]:
-    return {
-        "name": p.get("Name"),
-        "slug": p.get("Slug"),
-        "category": p.get("Category"),
-        "status": p.get("Status"),
-        "project_logo": p.get("ProjectLogo"),
-        "repository_url": p.get("RepositoryURL"),
-    }
+def foundation_of(record: Dict[str, Any]) -> Any:
+    return record["Foundation"]["ID"]
 
 
-def category_rank(category: Any) -> int:
-    if category == "TAG":
-        return 1
-    if category == "Graduated":
-        return 2
-    if category == "Incubating":
-        return 3
-    if category == "Sandbox":
-        return 4
-    # Unknown/None go last
-    return 99
+def slim_foundation_projects(foundation_ids: FrozenSet[str]) -> Callable[[Any], Optional[Dict[str, Any]]]:
+    """
+    A `keep` function for the crawl: only projects of `foundation_ids`,
+    reduced to PROJECT_FIELDS, while each page is decoded.
+    """
 
+    def keep(p: Any) -> Optional[Dict[str, Any]]:
+        record = slim_project(p)
+        return record if record is not None and foundation_of(record) in foundation_ids else None
 
-def main() -> None:
-    # Ensure datasources directory exists
-    os.makedirs(DATASOURCES_DIR, exist_ok=True)
-    token = get_lfx_token()
-    session = requests.Session()
-    session.headers.update(
-        {
-            "Authorization": f"Bearer {token}",
-            "Accept": "application/json",
-            "User-Agent": "project-status-audit/0.1 (+github actions)",
-        }
+    return keep
+
+
+slim_cncf_project = slim_foundation_projects(frozenset([FOUNDATION_ID_CNCF]))
+
+
+def full_sync_due(store: ProjectStore, every_days: float, now: Optional[float] = None) -> bool:
+    """
+    True when the last full crawl is older than `every_days`, or was never
+    recorded. `every_days` <= 0 turns the periodic reconcile off.
+    """
+    if every_days <= 0:
+        return False
+    last = store.get_meta("last_full_sync")
+    if not last:
+        return True
+    try:
+        last_seconds = calendar.timegm(time.strptime(last, TIMESTAMP_FORMAT))
+    except ValueError:
+        return True
+    return (time.time() if now is None else now) - last_seconds >= every_days * 86400
+
+
+def _newest(records: List[Dict[str, Any]], current: Optional[str]) -> Optional[str]:
+    stamps = [r[MODIFIED_FIELD] for r in records if isinstance(r.get(MODIFIED_FIELD), str)]
+    if current:
+        stamps.append(current)
+    return max(stamps) if stamps else None
+
+
+def sync_modified_since(
+    session: requests.Session,
+    bucket: TokenBucket,
+    store: ProjectStore,
+    since: str,
+    concurrency: int,
+    foundation_ids: FrozenSet[str],
+) -> Optional[Tuple[int, int]]:
+    """
+    Apply only the projects modified since the high-water mark `since`.
+
+    Every foundation is requested, so a project that moved out of the tracked
+    foundations is seen and removed. Returns (written, removed), or None when the API rejects or
+    ignores the modified-since parameter.
+    """
+    params = {MODIFIED_SINCE_PARAM: since, FIELDS_PARAM: ",".join(PROJECT_FIELDS)}
+    try:
+        first = get_page(session, API_URL, {**params, "offset": 0, "limit": PAGE_SIZE}, bucket, slim_project)
+    except requests.HTTPError as err:
+        if err.response is not None and err.response.status_code in UNSUPPORTED_QUERY_STATUS_CODES:
+            return None
+        raise
+    # An API that ignores the parameter returns projects older than the mark
+    honoured = page_count(first) == len(page_items(first)) and all(
+        isinstance(r.get(MODIFIED_FIELD), str) and r[MODIFIED_FIELD] >= since for r in page_items(first)
     )
+    if not honoured:
+        return None
+    checkpoint = PageCheckpoint(CHECKPOINT_DIR, {"url": API_URL, "limit": PAGE_SIZE, "fields": PROJECT_FIELDS, **params})
+    pages = crawl_pages(
+        session,
+        API_URL,
+        PAGE_SIZE,
+        concurrency=concurrency,
+        bucket=bucket,
+        checkpoint=checkpoint,
+        extra_params=params,
+        keep=slim_project,
+        first_page=first,
+    )
+    changed = [rec for _, page in pages for rec in page_items(page)]
+    written = store.upsert(r for r in changed if foundation_of(r) in foundation_ids)
+    removed = store.delete(project_key(r) for r in changed if foundation_of(r) not in foundation_ids)
+    store.set_meta("high_water_mark", _newest(changed, since))
+    checkpoint.clear()
+    return written, removed
+
+
+def full_crawl_query(foundation_ids: FrozenSet[str], params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Everything that determines the pages of a full crawl; keys its checkpoint
+    and tells whether the pages kept in the store came from the same query.
+    """
+    return {"url": API_URL, "limit": PAGE_SIZE, "fields": PROJECT_FIELDS, "foundations": sorted(foundation_ids), **params}
+
+
+def sync_full(
+    session: requests.Session,
+    bucket: TokenBucket,
+    store: ProjectStore,
+    concurrency: int,
+    no_resume: bool,
+    foundation_ids: FrozenSet[str],
+) -> Tuple[int, int]:
+    """
+    Crawl every project of `foundation_ids` in one pass. Pages kept from the
+    previous full crawl are revalidated with their ETag, and only pages whose
+    body hash changed are written to the store. Returns (written, removed).
+
+    An interrupted crawl whose checkpoint holds page 0 resumes with the query
+    parameters it was started with, without probing the API again.
+    """
+    keep = slim_foundation_projects(foundation_ids)
+    pushdown: Dict[str, Any] = {FIELDS_PARAM: ",".join(PROJECT_FIELDS)}
+    if len(foundation_ids) == 1:
+        # The API filter takes a single foundation; batches are split client-side
+        pushdown[FOUNDATION_FILTER_PARAM] = next(iter(foundation_ids))
+    params: Optional[Dict[str, Any]] = None
+    first_page: Optional[Dict[str, Any]] = None
+    if not no_resume:
+        # The pushdown query, or the unfiltered fallback if the probe had rejected it
+        for candidate in (pushdown, {}):
+            if PageCheckpoint(CHECKPOINT_DIR, full_crawl_query(foundation_ids, candidate)).has(0):
+                params = dict(candidate)
+                print("Resuming an interrupted crawl from its checkpoint", file=sys.stderr)
+                break
+    if params is None:
+        params, first_page = probe_query(session, API_URL, PAGE_SIZE, pushdown, bucket, keep=keep)
+        if first_page is not None and FOUNDATION_FILTER_PARAM in pushdown:
+            raw, kept = page_count(first_page), len(page_items(first_page))
+            if raw and raw == kept:
+                print("Server-side filtering active", file=sys.stderr)
+            else:
+                print(f"Server-side filtering ignored by the API ({kept} of {raw} projects kept); filtering client-side", file=sys.stderr)
+    query = full_crawl_query(foundation_ids, params)
+    checkpoint = PageCheckpoint(CHECKPOINT_DIR, query)
+    if no_resume:
+        checkpoint.clear()
+    query_key = json.dumps(query, sort_keys=True)
+    previous = store.pages() if store.get_meta("page_query") == query_key else {}
+    pages = crawl_pages(
+        session,
+        API_URL,
+        PAGE_SIZE,
+        concurrency=concurrency,
+        bucket=bucket,
+        checkpoint=checkpoint,
+        extra_params=params,
+        keep=keep,
+        first_page=first_page,
+        previous=previous,
+    )
+    written = store.upsert(
+        rec
+        for offset, page in pages
+        if (previous.get(offset) or {}).get("Sha256") != page.get("Sha256")
+        for rec in page_items(page)
+    )
+    removed = store.retain([project_key(rec) for _, page in pages for rec in page_items(page)])
+    store.replace_pages(pages)
+    store.set_meta("page_query", query_key)
+    store.set_meta("high_water_mark", _newest([r for _, page in pages for r in page_items(page)], None))
+    store.set_meta("last_full_sync", time.strftime(TIMESTAMP_FORMAT, time.gmtime()))
+    # The crawl completed, so its checkpoint is no longer needed
+    checkpoint.clear()
+    return written, removed
+
+
+class PccProject(NamedTuple):
+    """
+    One project as written to pcc_projects.yaml. `sort_key` is the lowercased
+    name, computed once instead of on every sort comparison.
+    """
+
+    sort_key: str
+    name: Any
+    slug: Any
+    category: Any
+    status: Any
+    project_logo: Any
+    repository_url: Any
+
+    @classmethod
+    def from_api(cls, p: Dict[str, Any]) -> "PccProject":
+        name = p.get("Name")
+        # tuple.__new__ skips the generated Python-level __new__, which dominates
+        # the cost of building one record
+        return tuple.__new__(cls, (
+            (name or "").lower(),
+            name,
+            p.get("Slug"),
+            p.get("Category"),
+            p.get("Status"),
+            p.get("ProjectLogo"),
+            p.get("RepositoryURL"),
+        ))
+
+    def active_record(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "slug": self.slug,
+            "category": self.category,
+            "status": self.status,
+            "project_logo": self.project_logo,
+            "repository_url": self.repository_url,
+        }
 
-    offset = 0
-    active_records: List[Dict[str, Any]] = []
-    forming_records: List[Dict[str, Any]] = []
-    archived_records: List[Dict[str, Any]] = []
-
-    while True:
-        data = fetch_page(session, offset=offset, limit=PAGE_SIZE)
-        items: List[Dict[str, Any]] = data.get("Data") or []
-        if not items:
-            break
-
-        for p in items:
-            try:
-                foundation = (p.get("Foundation") or {}).get("ID")
-                if foundation != FOUNDATION_ID_CNCF:
-                    continue
-                status = p.get("Status")
-                if status == "Active":
-                    record = project_to_record(p)
-                    active_records.append(record)
-                elif status == "Formation - Exploratory":
-                    # Forming projects are tracked separately with a reduced schema
-                    forming_records.append(
-                        {
-                            "name": p.get("Name"),
-                            "status": p.get("Status"),
-                            "project_logo": p.get("ProjectLogo"),
-                            "repository_url": p.get("RepositoryURL"),
-                        }
-                    )
-                else:
-                    # Anything not Active or Forming is considered archived/retired/other
-                    archived_records.append(
-                        {
-                            "name": p.get("Name"),
-                            "status": p.get("Status"),
-                            "category": p.get("Category"),
-                            "project_logo": p.get("ProjectLogo"),
-                            "repository_url": p.get("RepositoryURL"),
-                        }
-                    )
-            except Exception:
-                # Skip malformed entries but continue
+    def forming_record(self) -> Dict[str, Any]:
+        # Forming projects are tracked separately with a reduced schema
+        return {
+            "name": self.name,
+            "status": self.status,
+            "project_logo": self.project_logo,
+            "repository_url": self.repository_url,
+        }
+
+    def archived_record(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "status": self.status,
+            "category": self.category,
+            "project_logo": self.project_logo,
+            "repository_url": self.repository_url,
+        }
+
+
+class Categorised(NamedTuple):
+    categories: Dict[str, List[PccProject]]
+    forming: List[PccProject]
+    archived: List[PccProject]
+
+
+def categorise(items: Iterable[Dict[str, Any]], foundation_id: str = FOUNDATION_ID_CNCF) -> Categorised:
+    """
+    Route each project of `foundation_id` straight into its output bucket, then
+    sort each bucket by name once. Sorts are stable, so projects with the same
+    name keep their crawl order. A record is only built for a project that is
+    written out.
+    """
+    categories: Dict[str, List[PccProject]] = {k: [] for k in CATEGORY_KEYS}
+    forming: List[PccProject] = []
+    archived: List[PccProject] = []
+    from_api = PccProject.from_api
+    for p in items:
+        try:
+            if (p.get("Foundation") or {}).get("ID") != foundation_id:
                 continue
+            status = p.get("Status")
+            if status == STATUS_ACTIVE:
+                bucket = categories.get(p.get("Category"))
+                if bucket is not None:
+                    bucket.append(from_api(p))
+                # TAGs and unknown categories are left out of the categories section
+            elif status == STATUS_FORMING:
+                forming.append(from_api(p))
+            else:
+                # Anything not Active or Forming is considered archived/retired/other
+                archived.append(from_api(p))
+        except Exception:
+            # Skip malformed entries but continue
+            continue
 
-        offset += len(items)
-        time.sleep(SLEEP_BETWEEN_CALLS_SECONDS)
-
-    # Sort for stable output
-    active_records.sort(key=lambda r: (category_rank(r.get("category")), (r.get("name") or "").lower()))
-    forming_records.sort(key=lambda r: (r.get("name") or "").lower())
-    archived_records.sort(key=lambda r: (r.get("name") or "").lower())
-
-    # Group active projects by category, preserving desired order
-    # Exclude "TAG" from categories per requirements
-    category_keys = ["Graduated", "Incubating", "Sandbox"]
-    categories: Dict[str, List[Dict[str, Any]]] = {k: [] for k in category_keys}
-    for rec in active_records:
-        cat = rec.get("category")
-        if cat in categories:
-            categories[cat].append(rec)
-        else:
-            # unknown categories ignored from grouping to mimic calendar focus
-            pass
+    by_name = attrgetter("sort_key")
+    for bucket in categories.values():
+        bucket.sort(key=by_name)
+    forming.sort(key=by_name)
+    archived.sort(key=by_name)
+    return Categorised(categories, forming, archived)
 
-    output: Dict[str, Any] = {
+
+def build_output(result: Categorised, foundation_id: str = FOUNDATION_ID_CNCF) -> Dict[str, Any]:
+    return {
         "source": "LFX PCC project-service",
-        "foundation_id": FOUNDATION_ID_CNCF,
-        "categories": categories,
-        "forming_projects": forming_records,
-        "archived_projects": archived_records,
+        "foundation_id": foundation_id,
+        "categories": {k: [p.active_record() for p in v] for k, v in result.categories.items()},
+        "forming_projects": [p.forming_record() for p in result.forming],
+        "archived_projects": [p.archived_record() for p in result.archived],
     }
 
-    with open(OUTPUT_PATH, "w", encoding="utf-8") as f:
-        yaml.safe_dump(output, f, sort_keys=False, allow_unicode=True)
 
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Fetch CNCF (or, in batch mode, several foundations') projects from the LFX PCC API.")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Pages fetched in parallel once the total is known (default: {DEFAULT_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=DEFAULT_RATE_PER_SECOND,
+        help=f"Average requests per second across all workers; 0 disables pacing (default: {DEFAULT_RATE_PER_SECOND})",
+    )
+    parser.add_argument(
+        "--no-resume",
+        action="store_true",
+        help="Discard pages checkpointed by an interrupted run and crawl from scratch",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Rebuild the local project store from a full crawl instead of syncing only changes",
+    )
+    parser.add_argument(
+        "--full-every-days",
+        type=float,
+        default=DEFAULT_FULL_EVERY_DAYS,
+        metavar="DAYS",
+        help=(
+            "Crawl everything instead of syncing changes once the last full crawl is this old, so projects "
+            f"deleted upstream leave the store; 0 disables (default: {DEFAULT_FULL_EVERY_DAYS:g})"
+        ),
+    )
+    parser.add_argument(
+        "--foundation",
+        action="append",
+        default=[],
+        metavar="NAME[=ID]",
+        help=(
+            "Batch mode: crawl once and write datasources/pcc_projects.<NAME>.yaml for each foundation. "
+            f"NAME alone must be one of {sorted(KNOWN_FOUNDATIONS)}; repeatable"
+        ),
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const=PROFILE_OUTPUT_PATH,
+        metavar="JSON",
+        help=(
+            "Record stage timings, pages fetched, bytes, request latency percentiles and retries; write them as JSON "
+            f"(default: {os.path.relpath(PROFILE_OUTPUT_PATH)}) and print a summary on stderr"
+        ),
+    )
+    args = parser.parse_args(argv)
+    try:
+        args.foundations = parse_foundations(args.foundation)
+    except ValueError as err:
+        parser.error(str(err))
+    return args
+
+
+def parse_foundations(specs: List[str]) -> Dict[str, str]:
+    """
+    Map foundation names to LFX foundation IDs from NAME or NAME=ID specs.
+    """
+    foundations: Dict[str, str] = {}
+    for spec in specs:
+        name, sep, foundation_id = spec.partition("=")
+        name = name.strip().lower()
+        if not sep:
+            if name not in KNOWN_FOUNDATIONS:
+                raise ValueError(f"unknown foundation {name!r}; pass it as NAME=ID")
+            foundation_id = KNOWN_FOUNDATIONS[name]
+        if not name or not foundation_id or not re.fullmatch(r"[a-z0-9_-]+", name):
+            raise ValueError(f"invalid foundation {spec!r}; expected NAME=ID with NAME made of [a-z0-9_-]")
+        foundations[name] = foundation_id.strip()
+    return foundations
+
+
+def output_path_for(name: str) -> str:
+    return os.path.join(DATASOURCES_DIR, f"pcc_projects.{name}.yaml")
+
+
+def write_pcc_yaml(path: str, items: Iterable[Dict[str, Any]], foundation_id: str) -> None:
+    result = categorise(items, foundation_id)
+    with AtomicReport(path) as out:
+        yaml.safe_dump(build_output(result, foundation_id), out, sort_keys=False, allow_unicode=True)
     print(
-        f"Wrote {sum(len(v) for v in categories.values())} active projects, "
-        f"{len(forming_records)} forming projects, and {len(archived_records)} archived projects to {OUTPUT_PATH}"
+        f"Wrote {sum(len(v) for v in result.categories.values())} active projects, "
+        f"{len(result.forming)} forming projects, and {len(result.archived)} archived projects to {path}"
     )
 
 
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    if args.profile:
+        profiling.enable("fetch_pcc_projects")
+    # Ensure datasources directory exists
+    os.makedirs(DATASOURCES_DIR, exist_ok=True)
+    token = get_lfx_token()
+    concurrency = max(1, args.concurrency)
+    session = build_session(
+        {
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/json",
+            "User-Agent": "project-status-audit/0.1 (+github actions)",
+        },
+        pool_size=concurrency,
+    )
+    bucket = TokenBucket(args.rate, capacity=DEFAULT_BURST)
+    # Without --foundation, only CNCF is fetched, into pcc_projects.yaml
+    outputs = {output_path_for(n): fid for n, fid in args.foundations.items()} or {OUTPUT_PATH: FOUNDATION_ID_CNCF}
+    foundation_ids = frozenset(outputs.values())
+    store = ProjectStore(STORE_PATH)
+    try:
+        foundations_key = json.dumps(sorted(foundation_ids))
+        if args.full or store.get_meta("foundations") != foundations_key:
+            # A store synced for other foundations lacks the unchanged projects of these
+            store.reset()
+            store.set_meta("foundations", foundations_key)
+        since = store.get_meta("high_water_mark")
+        synced = None
+        mode = "full"
+        if since and len(store):
+            if full_sync_due(store, args.full_every_days):
+                # Deletions are only seen by a full crawl; unchanged pages still come back as 304s
+                mode = "full reconcile"
+            else:
+                with profiling.stage("sync_incremental"):
+                    synced = sync_modified_since(session, bucket, store, since, concurrency, foundation_ids)
+                if synced is not None:
+                    mode = "incremental"
+        if synced is None:
+            with profiling.stage("sync_full"):
+                synced = sync_full(session, bucket, store, concurrency, args.no_resume, foundation_ids)
+        with profiling.stage("store_commit"):
+            store.commit()
+        print(f"PCC store ({mode} sync): {synced[0]} projects written, {synced[1]} removed, {len(store)} total")
+        profiling.count("store", "written", synced[0])
+        profiling.count("store", "removed", synced[1])
+        with profiling.stage("store_read"):
+            items: List[Dict[str, Any]] = store.records()
+    finally:
+        store.close()
+
+    # One crawl, split by foundation
+    by_foundation: Dict[str, List[Dict[str, Any]]] = {fid: [] for fid in foundation_ids}
+    for p in items:
+        by_foundation[foundation_of(p)].append(p)
+    with profiling.stage("write_yaml"):
+        for path, foundation_id in outputs.items():
+            write_pcc_yaml(path, by_foundation[foundation_id], foundation_id)
+    profiling.finish(args.profile)
+
+
 if __name__ == "__main__":
     try:
         main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Polling file watcher for --watch mode.
+
+Each poll compares every watched file's (mtime_ns, size) with the previous
+poll, which costs one stat() per file. Only the standard library is used, so
+it works the same on every platform and inside containers where inotify is
+not available.
+"""
+import os
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Pause after a change before reading it, so an editor can finish writing the file
+DEFAULT_SETTLE_SECONDS = 0.1
+
+Signature = Optional[Tuple[int, int]]
+
+
+def file_signature(path: str) -> Signature:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class FileWatcher:
+    def __init__(self, paths: Iterable[str]) -> None:
+        self._signatures: Dict[str, Signature] = {path: file_signature(path) for path in dict.fromkeys(paths)}
+
+    def poll(self) -> List[str]:
+        """
+        Paths created, modified or deleted since the previous poll, in watch order.
+        """
+        changed: List[str] = []
+        for path, before in self._signatures.items():
+            now = file_signature(path)
+            if now != before:
+                self._signatures[path] = now
+                changed.append(path)
+        return changed
+
+    def wait(self, interval: float, settle: float = DEFAULT_SETTLE_SECONDS) -> List[str]:
+        """
+        Block until some watched file changes, then keep polling every `settle`
+        seconds until a poll sees no further change. Returns every changed path.
+        """
+        changed: List[str] = []
+        while not changed:
+            time.sleep(interval)
+            changed = self.poll()
+        while True:
+            time.sleep(settle)
+            more = self.poll()
+            if not more:
+                return changed
+            changed.extend(path for path in more if path not in changed)
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Trigram index for the fuzzy fallback matcher.
+
+Built once per run over the keys of an AliasIndex. Each key's padded character
+trigrams go into an inverted index. A lookup counts shared trigrams through the
+postings to pick a bounded set of candidates. Only those candidates are scored,
+with the Dice coefficient of the two trigram sets. No query is compared against
+every key.
+"""
+from collections import Counter
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+from alias_index import AliasIndex
+
+# Candidates per source that are scored exactly, chosen by shared trigram count
+MAX_CANDIDATES = 16
+# Trigrams shared by more keys than this carry little signal and are skipped
+# when collecting candidates (they still count in the final score)
+MAX_POSTING = 512
+MIN_KEY_LENGTH = 3
+
+
+def trigrams(text: str) -> FrozenSet[str]:
+    padded = f"  {text} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+def dice(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return 2 * len(a & b) / (len(a) + len(b))
+
+
+class FuzzyIndex:
+    __slots__ = ("aliases", "_keys", "_grams", "_postings")
+
+    def __init__(self, aliases: AliasIndex) -> None:
+        self.aliases = aliases
+        self._keys: List[str] = []
+        self._grams: List[FrozenSet[str]] = []
+        self._postings: Dict[str, List[int]] = {}
+
+    @classmethod
+    def build(cls, aliases: AliasIndex, skip_prefix: str = "") -> "FuzzyIndex":
+        """
+        Index every alias key, except those starting with `skip_prefix` (keys that
+        are not names, such as repository keys).
+        """
+        index = cls(aliases)
+        postings = index._postings
+        for key in aliases.keys():
+            if len(key) < MIN_KEY_LENGTH or (skip_prefix and key.startswith(skip_prefix)):
+                continue
+            kid = len(index._keys)
+            grams = trigrams(key)
+            index._keys.append(key)
+            index._grams.append(grams)
+            for gram in grams:
+                postings.setdefault(gram, []).append(kid)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def best_matches(self, query: str, sources: List[str], min_score: float) -> Dict[str, Tuple[str, float]]:
+        """
+        For each source in `sources`, the best-scoring key that source knows,
+        as (key, score), if it scores at least `min_score`.
+        """
+        if len(query) < MIN_KEY_LENGTH or not sources:
+            return {}
+        query_grams = trigrams(query)
+        shared: Counter = Counter()
+        for gram in query_grams:
+            posting = self._postings.get(gram)
+            if posting is not None and len(posting) <= MAX_POSTING:
+                shared.update(posting)
+        if not shared:
+            return {}
+
+        source_ids = [self.aliases.sources.index(src) for src in sources]
+        candidates: Dict[str, List[int]] = {src: [] for src in sources}
+        # Most shared trigrams first (ties in index order), enough to fill every
+        # bucket when the top keys are known to all the sources
+        for kid, _ in shared.most_common(MAX_CANDIDATES * len(sources)):
+            present = self.aliases.vector(self._keys[kid])
+            open_sources = 0
+            for src, sid in zip(sources, source_ids):
+                bucket = candidates[src]
+                if len(bucket) < MAX_CANDIDATES:
+                    open_sources += 1
+                    if present[sid]:
+                        bucket.append(kid)
+            if not open_sources:
+                break
+
+        scores: Dict[int, float] = {}
+        best: Dict[str, Tuple[str, float]] = {}
+        for src, kids in candidates.items():
+            top: Optional[Tuple[str, float]] = None
+            for kid in kids:
+                score = scores.get(kid)
+                if score is None:
+                    score = scores[kid] = dice(query_grams, self._grams[kid])
+                if score >= min_score and (top is None or score > top[1]):
+                    top = (self._keys[kid], score)
+            if top is not None:
+                best[src] = top
+        return best
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+State kept between incremental audit runs.
+
+A project's per-source statuses depend only on its query keys and on the values
+those keys have in each source's status map. The state therefore stores every
+source map together with each project's query keys and resolved statuses. On
+the next run only the keys whose value changed in some source are "dirty", and
+only projects that are new or that use a dirty key need to be resolved again.
+"""
+import os
+import pickle
+import tempfile
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+
+STATE_FORMAT = 3
+
+
+class ResolvedProject(NamedTuple):
+    query_keys: Tuple[str, ...]
+    # Repository key joined on, from the PCC repository URL; empty without a GitHub URL
+    repo_key: Tuple[str, ...]
+    # Normalized status per source name; empty when the source has no match
+    statuses: Dict[str, str]
+    # Alias key that produced each source's status; empty when there is no match
+    matched: Dict[str, str]
+
+
+class AuditState(NamedTuple):
+    code_version: str
+    sources: Tuple[str, ...]
+    source_shas: Dict[str, str]
+    maps: Dict[str, Dict[str, str]]
+    projects: Dict[str, ResolvedProject]
+
+
+def load_state(path: str, code_version: str, sources: List[str]) -> Optional[AuditState]:
+    """
+    Return the previous state, or None when it is missing, unreadable, or was
+    produced by different code or a different set of sources.
+    """
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "rb") as f:
+            fmt, state = pickle.load(f)
+    except Exception:
+        return None
+    if fmt != STATE_FORMAT or not isinstance(state, AuditState):
+        return None
+    if state.code_version != code_version or list(state.sources) != list(sources):
+        return None
+    return state
+
+
+def save_state(path: str, state: AuditState) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".audit_state.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump((STATE_FORMAT, state), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def changed_keys(old_map: Dict[str, str], new_map: Dict[str, str]) -> Set[str]:
+    """
+    Keys whose status changed, appeared or disappeared between two versions of
+    one source's map.
+    """
+    changed = {key for key, status in new_map.items() if old_map.get(key) != status}
+    changed.update(old_map.keys() - new_map.keys())
+    return changed
+
+
+def dirty_keys(previous: AuditState, maps: Dict[str, Dict[str, str]], source_shas: Dict[str, str]) -> Set[str]:
+    """
+    Keys whose status changed, appeared or disappeared in any source since the
+    previous run. Sources whose snapshot hash is unchanged are not diffed.
+    """
+    dirty: Set[str] = set()
+    for name, new_map in maps.items():
+        if previous.source_shas.get(name) == source_shas.get(name):
+            continue
+        dirty |= changed_keys(previous.maps.get(name) or {}, new_map)
+    return dirty
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Streaming extractor for landscape.yml.
+
+The audit only needs a few fields of each landscape item, yet loading the whole
+document builds every description, logo, URL and social handle as Python
+objects. This walks PyYAML's event stream instead and materialises one small
+dict per item, holding only ITEM_FIELDS and extra.EXTRA_FIELDS.
+"""
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+import yaml  # type: ignore
+from yaml.events import (  # type: ignore
+    CollectionStartEvent,
+    MappingEndEvent,
+    MappingStartEvent,
+    ScalarEvent,
+    SequenceEndEvent,
+    SequenceStartEvent,
+)
+
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Item fields the audit reads; everything else is skipped without being built
+ITEM_FIELDS = ("name", "project", "repo_url")
+EXTRA_FIELDS = ("lfx_slug",)
+
+# Plain scalars the YAML core schema resolves to null
+_NULL_SCALARS = {"", "~", "null", "Null", "NULL"}
+
+
+def _skip(events: Iterator[Any], start: Any) -> None:
+    # Consume the rest of the node opened by `start`
+    if not isinstance(start, CollectionStartEvent):
+        return
+    depth = 1
+    for ev in events:
+        if isinstance(ev, CollectionStartEvent):
+            depth += 1
+        elif isinstance(ev, (MappingEndEvent, SequenceEndEvent)):
+            depth -= 1
+            if depth == 0:
+                return
+
+
+def _scalar(events: Iterator[Any], ev: Any) -> Optional[str]:
+    if not isinstance(ev, ScalarEvent):
+        _skip(events, ev)
+        return None
+    if ev.implicit[0] and ev.value in _NULL_SCALARS:
+        return None
+    return ev.value
+
+
+def _pairs(events: Iterator[Any]) -> Iterator[Tuple[Optional[str], Any]]:
+    # Yield (key, value start event) for a mapping whose start was just consumed.
+    # The caller must consume each value before asking for the next pair.
+    for ev in events:
+        if isinstance(ev, MappingEndEvent):
+            return
+        key = ev.value if isinstance(ev, ScalarEvent) else None
+        _skip(events, ev)
+        yield key, next(events)
+
+
+def _children(events: Iterator[Any], start: Any, key: str) -> Iterator[Any]:
+    # Yield the start event of each element of mapping[key], skipping the other keys
+    if not isinstance(start, MappingStartEvent):
+        _skip(events, start)
+        return
+    for k, value in _pairs(events):
+        if k != key or not isinstance(value, SequenceStartEvent):
+            _skip(events, value)
+            continue
+        for ev in events:
+            if isinstance(ev, SequenceEndEvent):
+                break
+            yield ev
+
+
+def _read_item(events: Iterator[Any]) -> Dict[str, Any]:
+    item: Dict[str, Any] = {}
+    for key, value in _pairs(events):
+        if key in ITEM_FIELDS:
+            item[key] = _scalar(events, value)
+        elif key == "extra" and isinstance(value, MappingStartEvent):
+            extra: Dict[str, Any] = {}
+            for ekey, evalue in _pairs(events):
+                if ekey in EXTRA_FIELDS:
+                    extra[ekey] = _scalar(events, evalue)
+                else:
+                    _skip(events, evalue)
+            item["extra"] = extra
+        else:
+            _skip(events, value)
+    return item
+
+
+def iter_landscape_items(stream: Any) -> Iterator[Dict[str, Any]]:
+    """
+    Yield one reduced dict per landscape.landscape[].subcategories[].items[] entry,
+    in document order. `stream` is YAML text or a file object.
+    """
+    events = iter(yaml.parse(stream, Loader=YAML_LOADER))
+    for ev in events:
+        if not isinstance(ev, MappingStartEvent):
+            continue
+        for cat in _children(events, ev, "landscape"):
+            for sub in _children(events, cat, "subcategories"):
+                for item in _children(events, sub, "items"):
+                    if isinstance(item, MappingStartEvent):
+                        yield _read_item(events)
+                    else:
+                        _skip(events, item)
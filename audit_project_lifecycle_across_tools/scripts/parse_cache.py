@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+On-disk cache of parsed datasources.
+
+Each entry holds the status map built from one source, pickled, and is keyed
+by the SHA-256 of the source text plus a code version. When neither the
+snapshot nor the parsing code changed, a run loads the map directly and skips
+YAML/HTML parsing entirely.
+"""
+import hashlib
+import os
+import pickle
+import tempfile
+from typing import Any, Callable, Optional
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+_code_version: Optional[str] = None
+
+
+def code_version() -> str:
+    """
+    Digest of every script next to this module, so any code change invalidates
+    the cache without having to remember to bump a constant.
+    """
+    global _code_version
+    if _code_version is None:
+        h = hashlib.sha256()
+        for fname in sorted(os.listdir(SCRIPTS_DIR)):
+            if fname.endswith(".py"):
+                with open(os.path.join(SCRIPTS_DIR, fname), "rb") as f:
+                    h.update(fname.encode("utf-8"))
+                    h.update(f.read())
+        _code_version = h.hexdigest()
+    return _code_version
+
+
+def cache_key(source_sha256: str) -> str:
+    return f"{source_sha256}:{code_version()}"
+
+
+def _entry_path(cache_dir: str, name: str) -> str:
+    return os.path.join(cache_dir, f"{name}.pickle")
+
+
+def load(cache_dir: str, name: str, key: str) -> Optional[Any]:
+    path = _entry_path(cache_dir, name)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "rb") as f:
+            stored_key, value = pickle.load(f)
+    except Exception:
+        # Corrupt or incompatible entry; treat as a miss and let it be rewritten
+        return None
+    return value if stored_key == key else None
+
+
+def store(cache_dir: str, name: str, key: str, value: Any) -> None:
+    # One entry per source: a new key replaces the old one, keeping the cache bounded
+    os.makedirs(cache_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix=f".{name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump((key, value), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, _entry_path(cache_dir, name))
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def get(cache_dir: Optional[str], name: str, source_sha256: str) -> Optional[Any]:
+    """
+    Return the cached value for (name, source_sha256), or None on a miss.
+    A cache_dir of None disables caching.
+    """
+    if cache_dir is None:
+        return None
+    return load(cache_dir, name, cache_key(source_sha256))
+
+
+def put(cache_dir: Optional[str], name: str, source_sha256: str, value: Any) -> None:
+    if cache_dir is not None:
+        store(cache_dir, name, cache_key(source_sha256), value)
+
+
+def cached_build(cache_dir: Optional[str], name: str, source_sha256: str, build: Callable[[], Any]) -> Any:
+    """
+    Return the cached value for (name, source_sha256) or compute it with build()
+    and store it.
+    """
+    value = get(cache_dir, name, source_sha256)
+    if value is None:
+        value = build()
+        put(cache_dir, name, source_sha256, value)
+    return value
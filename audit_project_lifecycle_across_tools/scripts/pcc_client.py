@@ -0,0 +1,416 @@
+#!/usr/bin/env python3
+"""
+Fetch engine for the paginated LFX PCC project-service API.
+
+The first page reports the total number of projects, so the remaining offsets
+are fetched concurrently instead of one page at a time. Requests are paced by a
+token bucket rather than a fixed sleep, and every page is checkpointed to disk
+so an interrupted crawl resumes with only the missing pages.
+
+Pages are decoded as a stream: each project is decoded on its own and passed
+through a `keep` function that can drop or slim it, so a page never exists in
+memory as a full decoded document.
+
+Each page also records its ETag and the SHA-256 of its body. Given the pages of
+a previous crawl, a page is requested conditionally and reused on a 304.
+"""
+import codecs
+import hashlib
+import json
+import os
+import shutil
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+import profiling
+
+DEFAULT_TIMEOUT_SECONDS = 30
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF_SECONDS = 1.0
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+STREAM_CHUNK_BYTES = 64 * 1024
+# Statuses meaning the API rejected query parameters it does not understand
+UNSUPPORTED_QUERY_STATUS_CODES = {400, 422}
+# Profiling counter group for requests to the PCC API
+PROFILE_GROUP = "pcc_api"
+
+# Characters that can continue a JSON number after a valid prefix of it
+_NUMBER_CHARS = frozenset(".eE+-0123456789")
+
+# Maps a raw project to the record to keep, or None to drop it
+KeepFn = Callable[[Any], Optional[Dict[str, Any]]]
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: on average `rate` acquisitions per second, with
+    bursts of up to `capacity`.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0) -> None:
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class PageCheckpoint:
+    """
+    Pages fetched so far by a crawl, one JSON file per offset. The directory is
+    keyed by the crawl parameters, so a resumed crawl never mixes in pages from
+    a different query.
+    """
+
+    def __init__(self, root: str, params: Dict[str, Any]) -> None:
+        digest = hashlib.sha256(json.dumps(params, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+        self.directory = os.path.join(root, digest)
+
+    def _page_path(self, offset: int) -> str:
+        return os.path.join(self.directory, f"offset-{offset:08d}.json")
+
+    def has(self, offset: int) -> bool:
+        return os.path.exists(self._page_path(offset))
+
+    def load(self) -> Dict[int, Dict[str, Any]]:
+        pages: Dict[int, Dict[str, Any]] = {}
+        if not os.path.isdir(self.directory):
+            return pages
+        for fname in os.listdir(self.directory):
+            if not (fname.startswith("offset-") and fname.endswith(".json")):
+                continue
+            try:
+                with open(os.path.join(self.directory, fname), "r", encoding="utf-8") as f:
+                    pages[int(fname[len("offset-"):-len(".json")])] = json.load(f)
+            except (OSError, ValueError):
+                # A page cut short by the interruption; it will be fetched again
+                continue
+        return pages
+
+    def save(self, offset: int, page: Dict[str, Any]) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = self._page_path(offset) + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(page, f)
+        os.replace(tmp_path, self._page_path(offset))
+
+    def clear(self) -> None:
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+def build_session(headers: Dict[str, str], pool_size: int) -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(headers)
+    return session
+
+
+def iter_json_members(chunks: Iterable[str], array_key: str) -> Iterator[Tuple[str, Any]]:
+    """
+    Incrementally decode a top-level JSON object from text chunks. Each element
+    of the `array_key` array is yielded as (array_key, element) as soon as it is
+    complete; every other member is yielded whole as (key, value).
+    """
+    decoder = json.JSONDecoder()
+    chunk_iter = iter(chunks)
+    buf = ""
+    pos = 0
+    eof = False
+
+    def more() -> bool:
+        nonlocal buf, pos, eof
+        if eof:
+            return False
+        for chunk in chunk_iter:
+            if chunk:
+                buf = buf[pos:] + chunk
+                pos = 0
+                return True
+        eof = True
+        return False
+
+    def peek() -> str:
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos] in " \t\r\n":
+                pos += 1
+            if pos < len(buf):
+                return buf[pos]
+            if not more():
+                raise ValueError("Unexpected end of JSON stream")
+
+    def expect(ch: str) -> None:
+        nonlocal pos
+        if peek() != ch:
+            raise ValueError(f"Expected {ch!r} in JSON stream, found {buf[pos]!r}")
+        pos += 1
+
+    def value() -> Any:
+        nonlocal pos
+        peek()
+        while True:
+            try:
+                result, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if not more():
+                    raise
+                continue
+            # A number may continue in the next chunk: raw_decode stops at the buffer
+            # end, or before a "." or exponent that has not been completed yet
+            number = isinstance(result, (int, float)) and not isinstance(result, bool)
+            if number and (end == len(buf) or buf[end] in _NUMBER_CHARS) and not eof and more():
+                continue
+            if end == len(buf) and not eof and more():
+                continue
+            pos = end
+            return result
+
+    expect("{")
+    if peek() == "}":
+        return
+    while True:
+        key = value()
+        expect(":")
+        if key == array_key and peek() == "[":
+            pos += 1
+            if peek() != "]":
+                while True:
+                    yield key, value()
+                    if peek() == ",":
+                        pos += 1
+                        continue
+                    break
+            expect("]")
+        else:
+            yield key, value()
+        if peek() == ",":
+            pos += 1
+            continue
+        expect("}")
+        return
+
+
+def decode_page(chunks: Iterable[str], keep: Optional[KeepFn] = None) -> Dict[str, Any]:
+    """
+    Stream-decode one API page into {"Data": kept records, "Metadata": ..., "RawCount": n},
+    where n is the number of projects the server returned (used for pagination).
+    """
+    kept: List[Dict[str, Any]] = []
+    raw_count = 0
+    page: Dict[str, Any] = {}
+    for key, val in iter_json_members(chunks, "Data"):
+        if key != "Data":
+            page[key] = val
+            continue
+        raw_count += 1
+        record = keep(val) if keep is not None else val
+        if record is not None:
+            kept.append(record)
+    page["Data"] = kept
+    page["RawCount"] = raw_count
+    return page
+
+
+def _text_chunks(response: requests.Response, digest: Any) -> Iterator[str]:
+    decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")()
+    for chunk in response.iter_content(chunk_size=STREAM_CHUNK_BYTES):
+        digest.update(chunk)
+        profiling.count(PROFILE_GROUP, "bytes", len(chunk))
+        yield decoder.decode(chunk)
+    yield decoder.decode(b"", final=True)
+
+
+def get_page(
+    session: requests.Session,
+    url: str,
+    params: Dict[str, Any],
+    bucket: Optional[TokenBucket] = None,
+    keep: Optional[KeepFn] = None,
+    etag: Optional[str] = None,
+    timeout: float = DEFAULT_TIMEOUT_SECONDS,
+    retries: int = DEFAULT_RETRIES,
+    backoff: float = DEFAULT_BACKOFF_SECONDS,
+) -> Optional[Dict[str, Any]]:
+    """
+    GET and stream-decode one page, retrying connection errors, timeouts and
+    retryable HTTP statuses with exponential backoff. Every attempt takes a
+    token from `bucket`. With `etag` the request is conditional and None is
+    returned when the server answers 304 Not Modified.
+    """
+    headers = {"If-None-Match": etag} if etag else None
+    attempt = 0
+    while True:
+        if bucket is not None:
+            bucket.acquire()
+        # Latency covers the whole streamed page, measured after the rate limiter
+        start = time.perf_counter()
+        try:
+            with session.get(url, params=params, headers=headers, timeout=timeout, stream=True) as response:
+                if etag and response.status_code == 304:
+                    profiling.observe(PROFILE_GROUP, time.perf_counter() - start)
+                    profiling.count(PROFILE_GROUP, "not_modified")
+                    return None
+                response.raise_for_status()
+                digest = hashlib.sha256()
+                page = decode_page(_text_chunks(response, digest), keep)
+                page["Sha256"] = digest.hexdigest()
+                if response.headers.get("ETag"):
+                    page["ETag"] = response.headers["ETag"]
+                profiling.observe(PROFILE_GROUP, time.perf_counter() - start)
+                profiling.count(PROFILE_GROUP, "pages_fetched")
+                profiling.count(PROFILE_GROUP, "projects_received", page["RawCount"])
+                profiling.count(PROFILE_GROUP, "projects_kept", len(page["Data"]))
+                return page
+        except (
+            requests.ConnectionError,
+            requests.Timeout,
+            requests.HTTPError,
+            requests.exceptions.ChunkedEncodingError,
+        ) as err:
+            status = err.response.status_code if err.response is not None else None
+            if attempt >= retries or (status is not None and status not in RETRY_STATUS_CODES):
+                profiling.count(PROFILE_GROUP, "failed_requests")
+                raise
+            profiling.count(PROFILE_GROUP, "retries")
+            time.sleep(backoff * (2 ** attempt))
+            attempt += 1
+
+
+def page_items(page: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return page.get("Data") or []
+
+
+def page_count(page: Dict[str, Any]) -> int:
+    # Projects the server returned for the page, before `keep` dropped any
+    return page.get("RawCount", len(page_items(page)))
+
+
+def probe_query(
+    session: requests.Session,
+    url: str,
+    page_size: int,
+    pushdown: Dict[str, Any],
+    bucket: Optional[TokenBucket] = None,
+    keep: Optional[KeepFn] = None,
+) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+    """
+    Try the first page with server-side filter/projection parameters.
+
+    Returns (params to crawl with, first page or None). If the API rejects the
+    parameters the crawl falls back to no extra parameters. If it accepts but
+    ignores them the pages are simply unfiltered; `keep` still filters every
+    project client-side, so the result is the same either way.
+    """
+    if not pushdown:
+        return {}, None
+    try:
+        page = get_page(session, url, {**pushdown, "offset": 0, "limit": page_size}, bucket, keep)
+    except requests.HTTPError as err:
+        if err.response is not None and err.response.status_code in UNSUPPORTED_QUERY_STATUS_CODES:
+            print("Query parameters rejected by the API; crawling without them and filtering client-side", file=sys.stderr)
+            return {}, None
+        raise
+    return dict(pushdown), page
+
+
+def page_total(page: Dict[str, Any]) -> Optional[int]:
+    total = (page.get("Metadata") or {}).get("TotalSize")
+    return total if isinstance(total, int) and total >= 0 else None
+
+
+def crawl_pages(
+    session: requests.Session,
+    url: str,
+    page_size: int,
+    concurrency: int = 4,
+    bucket: Optional[TokenBucket] = None,
+    checkpoint: Optional[PageCheckpoint] = None,
+    extra_params: Optional[Dict[str, Any]] = None,
+    keep: Optional[KeepFn] = None,
+    first_page: Optional[Dict[str, Any]] = None,
+    previous: Optional[Dict[int, Dict[str, Any]]] = None,
+) -> List[Tuple[int, Dict[str, Any]]]:
+    """
+    Fetch every page and return (offset, page) pairs in offset order.
+    `first_page` is a page 0 already fetched with the same parameters (see
+    probe_query). `previous` holds the pages of an earlier crawl of the same
+    query; any of them with an ETag is revalidated rather than fetched again.
+
+    Offsets below the total reported by the first page are fetched concurrently,
+    stepping by the size the server actually returned for that page. The crawl
+    then continues one page at a time until an empty page, as a crawl without a
+    reported total does, which also picks up projects added while it ran.
+    """
+    extra_params = dict(extra_params or {})
+    pages: Dict[int, Dict[str, Any]] = checkpoint.load() if checkpoint else {}
+    profiling.count(PROFILE_GROUP, "pages_resumed", len(pages))
+    if first_page is not None and 0 not in pages:
+        pages[0] = first_page
+        if checkpoint:
+            checkpoint.save(0, first_page)
+
+    previous = previous or {}
+
+    def fetch(offset: int) -> Dict[str, Any]:
+        page = pages.get(offset)
+        if page is None:
+            prior = previous.get(offset)
+            page = get_page(
+                session,
+                url,
+                {**extra_params, "offset": offset, "limit": page_size},
+                bucket,
+                keep,
+                etag=prior.get("ETag") if prior else None,
+            )
+            if page is None:
+                page = prior
+            if checkpoint:
+                checkpoint.save(offset, page)
+        return page
+
+    first = fetch(0)
+    pages[0] = first
+    total = page_total(first)
+    step = page_count(first)
+    if total is not None and 0 < step < total:
+        offsets = [o for o in range(step, total, step) if o not in pages]
+        workers = max(1, min(concurrency, len(offsets)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for offset, page in zip(offsets, pool.map(fetch, offsets)):
+                pages[offset] = page
+
+    offset = 0
+    ordered: List[Tuple[int, Dict[str, Any]]] = []
+    while True:
+        page = pages.get(offset)
+        if page is None:
+            page = pages[offset] = fetch(offset)
+        count = page_count(page)
+        if not count:
+            break
+        ordered.append((offset, page))
+        offset += count
+    return ordered
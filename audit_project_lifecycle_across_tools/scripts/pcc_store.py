@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Local SQLite store of the projects fetched from LFX PCC, for one or more
+foundations (CNCF by default).
+
+The store keeps every project of the foundations it was synced for (as the
+slim record the YAML is built from) with its last-modified marker, plus the
+validators (ETag and body hash) of the pages of the last full crawl. A sync
+then only writes the projects that actually changed, and each foundation's
+pcc_projects YAML is regenerated from the store. fetch_pcc_projects records
+the foundation set in the meta table and resets the store when it changes.
+"""
+import json
+import os
+import sqlite3
+import sys
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+STORE_FORMAT = "1"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS projects (
+    id TEXT PRIMARY KEY,
+    seq INTEGER NOT NULL,
+    updated_at TEXT,
+    record TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS pages (
+    offset INTEGER PRIMARY KEY,
+    etag TEXT,
+    sha256 TEXT,
+    raw_count INTEGER NOT NULL,
+    ids TEXT NOT NULL
+);
+"""
+
+
+def project_key(record: Dict[str, Any]) -> str:
+    # LFX project ID, falling back to the slug/name for records without one;
+    # "" for a record with none of them, which the store refuses
+    return record.get("ID") or record.get("Slug") or record.get("Name") or ""
+
+
+class ProjectStore:
+    """
+    Projects keyed by LFX project ID, ordered by `seq` (the order of the last
+    full crawl, with projects added later appended), so the YAML comes out in
+    the same order as a full crawl would produce it.
+    """
+
+    def __init__(self, path: str) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(_SCHEMA)
+        if self.get_meta("format") != STORE_FORMAT:
+            self.reset()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def reset(self) -> None:
+        with self.conn:
+            self.conn.execute("DELETE FROM projects")
+            self.conn.execute("DELETE FROM pages")
+            self.conn.execute("DELETE FROM meta")
+            self.conn.execute("INSERT INTO meta (key, value) VALUES ('format', ?)", (STORE_FORMAT,))
+
+    def get_meta(self, key: str) -> Optional[str]:
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: Optional[str]) -> None:
+        if value is None:
+            self.conn.execute("DELETE FROM meta WHERE key = ?", (key,))
+        else:
+            self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM projects").fetchone()[0]
+
+    def records(self) -> List[Dict[str, Any]]:
+        return [json.loads(r) for (r,) in self.conn.execute("SELECT record FROM projects ORDER BY seq, id")]
+
+    def pages(self) -> Dict[int, Dict[str, Any]]:
+        """
+        The pages of the last full crawl, rebuilt from the store in the shape
+        pcc_client returns them, so an unchanged page can be reused as is.
+        """
+        by_id = {pid: json.loads(rec) for pid, rec in self.conn.execute("SELECT id, record FROM projects")}
+        pages: Dict[int, Dict[str, Any]] = {}
+        for offset, etag, sha, raw_count, ids in self.conn.execute(
+            "SELECT offset, etag, sha256, raw_count, ids FROM pages"
+        ):
+            data = [by_id[pid] for pid in json.loads(ids) if pid in by_id]
+            pages[offset] = {"Data": data, "RawCount": raw_count, "ETag": etag, "Sha256": sha}
+        return pages
+
+    def upsert(self, records: Iterable[Dict[str, Any]]) -> int:
+        """
+        Insert or update records, writing only rows whose record changed. New
+        projects are appended after the current last `seq`. Records without an
+        ID, slug or name would all share one row, so they are skipped with a
+        warning. Returns the number of rows written.
+        """
+        written = 0
+        skipped = 0
+        next_seq = (self.conn.execute("SELECT MAX(seq) FROM projects").fetchone()[0] or 0) + 1
+        for record in records:
+            pid = project_key(record)
+            if not pid:
+                skipped += 1
+                continue
+            encoded = json.dumps(record, sort_keys=True)
+            row = self.conn.execute("SELECT record FROM projects WHERE id = ?", (pid,)).fetchone()
+            if row is None:
+                self.conn.execute(
+                    "INSERT INTO projects (id, seq, updated_at, record) VALUES (?, ?, ?, ?)",
+                    (pid, next_seq, record.get("UpdatedAt"), encoded),
+                )
+                next_seq += 1
+            elif row[0] != encoded:
+                self.conn.execute(
+                    "UPDATE projects SET updated_at = ?, record = ? WHERE id = ?",
+                    (record.get("UpdatedAt"), encoded, pid),
+                )
+            else:
+                continue
+            written += 1
+        if skipped:
+            print(f"Warning: skipped {skipped} PCC records with no ID, slug or name", file=sys.stderr)
+        return written
+
+    def delete(self, ids: Iterable[str]) -> int:
+        cur = self.conn.executemany("DELETE FROM projects WHERE id = ?", ((pid,) for pid in ids if pid))
+        return max(cur.rowcount, 0)
+
+    def retain(self, ordered_ids: List[str]) -> int:
+        """
+        After a full crawl: drop projects the crawl no longer returned and set
+        `seq` to the crawl order. Returns the number of projects removed.
+        """
+        ordered_ids = [pid for pid in ordered_ids if pid]
+        keep = json.dumps(ordered_ids)
+        cur = self.conn.execute("DELETE FROM projects WHERE id NOT IN (SELECT value FROM json_each(?))", (keep,))
+        removed = max(cur.rowcount, 0)
+        self.conn.executemany(
+            "UPDATE projects SET seq = ? WHERE id = ? AND seq != ?",
+            ((seq, pid, seq) for seq, pid in enumerate(ordered_ids, start=1)),
+        )
+        return removed
+
+    def replace_pages(self, pages: List[Tuple[int, Dict[str, Any]]]) -> None:
+        self.conn.execute("DELETE FROM pages")
+        self.conn.executemany(
+            "INSERT INTO pages (offset, etag, sha256, raw_count, ids) VALUES (?, ?, ?, ?, ?)",
+            (
+                (
+                    offset,
+                    page.get("ETag"),
+                    page.get("Sha256"),
+                    page.get("RawCount", 0),
+                    json.dumps([pid for pid in map(project_key, page.get("Data") or []) if pid]),
+                )
+                for offset, page in pages
+            ),
+        )
+
+    def commit(self) -> None:
+        self.conn.commit()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Opt-in instrumentation for the audit and PCC fetch scripts.
+
+A Profiler records per-stage wall time and tracemalloc peak memory, named
+counters grouped per source (items parsed, cache hits, retries, ...) and
+latency samples summarised as percentiles. The scripts report through the
+module-level helpers below, which do nothing until enable() is called by
+--profile, so instrumented code needs no profiler argument threaded through it.
+
+Stages may nest; an outer stage's peak includes its inner stages. Memory is
+only traced in the process that enabled profiling, so work done in worker
+processes shows up in time and counters but not in peak memory.
+"""
+import json
+import os
+import platform
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, TextIO
+
+REPORT_FORMAT = 1
+PERCENTILES = (50, 90, 99)
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    # Nearest-rank percentile of an already sorted, non-empty list
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[int(rank) - 1]
+
+
+class Profiler:
+    def __init__(self, name: str, enabled: bool = True, trace_memory: bool = True) -> None:
+        self.name = name
+        self.enabled = enabled
+        self.trace_memory = enabled and trace_memory
+        self.stages: Dict[str, Dict[str, float]] = {}
+        self.counters: Dict[str, Dict[str, float]] = {}
+        self.samples: Dict[str, List[float]] = {}
+        # Running peak of every open stage, innermost last
+        self._open_peaks: List[int] = []
+        self._lock = threading.Lock()
+        self._started = time.perf_counter()
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+        start_bytes = 0
+        if self.trace_memory:
+            if self._open_peaks:
+                self._open_peaks[-1] = max(self._open_peaks[-1], tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+            start_bytes = tracemalloc.get_traced_memory()[0]
+            self._open_peaks.append(start_bytes)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            entry = self.stages.setdefault(name, {"calls": 0, "seconds": 0.0})
+            entry["calls"] += 1
+            entry["seconds"] += seconds
+            if self.trace_memory:
+                peak = max(self._open_peaks.pop(), tracemalloc.get_traced_memory()[1])
+                if self._open_peaks:
+                    self._open_peaks[-1] = max(self._open_peaks[-1], peak)
+                entry["peak_bytes"] = max(entry.get("peak_bytes", 0), peak)
+                entry["peak_over_start_bytes"] = max(entry.get("peak_over_start_bytes", 0), peak - start_bytes)
+
+    def count(self, group: str, counter: str, n: float = 1) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            counters = self.counters.setdefault(group, {})
+            counters[counter] = counters.get(counter, 0) + n
+
+    def observe(self, group: str, value: float) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self.samples.setdefault(group, []).append(value)
+
+    def latency_summary(self) -> Dict[str, Dict[str, float]]:
+        summary: Dict[str, Dict[str, float]] = {}
+        for group, values in self.samples.items():
+            ordered = sorted(values)
+            stats: Dict[str, float] = {"count": len(ordered)}
+            for pct in PERCENTILES:
+                stats[f"p{pct}"] = percentile(ordered, pct)
+            stats["max"] = ordered[-1]
+            summary[group] = stats
+        return summary
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            "format": REPORT_FORMAT,
+            "script": self.name,
+            "python": platform.python_version(),
+            "memory_traced": self.trace_memory,
+            "total_seconds": time.perf_counter() - self._started,
+            "stages": self.stages,
+            "counters": self.counters,
+            "latency_seconds": self.latency_summary(),
+        }
+
+    def write_report(self, path: str) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=2, sort_keys=True)
+            f.write("\n")
+
+    def print_summary(self, out: TextIO = sys.stderr) -> None:
+        report = self.report()
+        print(f"Profile of {self.name}: {report['total_seconds']:.3f}s total", file=out)
+        for name, entry in self.stages.items():
+            memory = f"  peak {entry['peak_bytes'] / 2**20:8.1f} MiB" if "peak_bytes" in entry else ""
+            print(f"  {name:<32} {entry['seconds']:8.3f}s{memory}", file=out)
+        for group, counters in sorted(self.counters.items()):
+            values = ", ".join(f"{k}={v:g}" for k, v in sorted(counters.items()))
+            print(f"  {group}: {values}", file=out)
+        for group, stats in sorted(report["latency_seconds"].items()):
+            values = ", ".join(f"{k}={v * 1000:.0f}ms" for k, v in stats.items() if k != "count")
+            print(f"  {group} latency ({stats['count']:g} requests): {values}", file=out)
+
+
+_current = Profiler("disabled", enabled=False)
+
+
+def enable(name: str, trace_memory: bool = True) -> Profiler:
+    """
+    Start profiling this process; every helper below reports to the returned profiler.
+    """
+    global _current
+    _current = Profiler(name, enabled=True, trace_memory=trace_memory)
+    return _current
+
+
+def current() -> Profiler:
+    return _current
+
+
+def stage(name: str) -> Any:
+    return _current.stage(name)
+
+
+def count(group: str, counter: str, n: float = 1) -> None:
+    _current.count(group, counter, n)
+
+
+def observe(group: str, value: float) -> None:
+    _current.observe(group, value)
+
+
+def finish(path: Optional[str]) -> None:
+    """
+    Write the JSON report to `path` and a summary to stderr, if profiling is on.
+    """
+    if not _current.enabled:
+        return
+    if path:
+        _current.write_report(path)
+    _current.print_summary()
+    if path:
+        print(f"Wrote profile to {path}", file=sys.stderr)
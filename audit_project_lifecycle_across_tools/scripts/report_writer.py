@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Atomic, streamed writes for the generated reports.
+
+A report is streamed through a buffered binary writer into a temporary file
+next to its destination and hashed as it goes. On success the temporary file
+replaces the destination with os.replace, so a crash never leaves a truncated
+report behind. If the new content is byte-identical to the existing file, the
+destination is left untouched (same mtime, no git churn) and the temporary file
+is discarded.
+
+atomic_path gives the same replace-on-success guarantee to a writer that only
+takes a file name, such as pyarrow.parquet.write_table.
+"""
+import hashlib
+import os
+import tempfile
+from contextlib import contextmanager
+from types import TracebackType
+from typing import BinaryIO, Iterable, Iterator, Optional, Type
+
+import profiling
+
+WRITE_BUFFER_BYTES = 256 * 1024
+HASH_CHUNK_BYTES = 1024 * 1024
+# Mode for a newly created report; mkstemp would otherwise leave it owner-only
+NEW_FILE_MODE = 0o644
+
+
+def file_sha256(path: str) -> Optional[str]:
+    try:
+        with open(path, "rb") as f:
+            h = hashlib.sha256()
+            for chunk in iter(lambda: f.read(HASH_CHUNK_BYTES), b""):
+                h.update(chunk)
+            return h.hexdigest()
+    except OSError:
+        return None
+
+
+def _replace_keeping_mode(tmp_path: str, path: str) -> None:
+    try:
+        mode = os.stat(path).st_mode & 0o777
+    except OSError:
+        mode = NEW_FILE_MODE
+    os.chmod(tmp_path, mode)
+    os.replace(tmp_path, path)
+
+
+@contextmanager
+def atomic_path(path: str) -> Iterator[str]:
+    """
+    Yield a temporary path next to `path` to write to; it replaces `path` only
+    if the block succeeds, and is removed otherwise.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.")
+    os.close(fd)
+    try:
+        yield tmp_path
+        _replace_keeping_mode(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+
+
+class AtomicReport:
+    """
+    Context manager that writes text to `path` atomically:
+
+        with AtomicReport(path) as out:
+            out.write("...")
+
+    `changed` tells afterwards whether the destination was replaced.
+    """
+
+    def __init__(self, path: str, encoding: str = "utf-8") -> None:
+        self.path = path
+        self.encoding = encoding
+        self.changed = False
+        self._digest = hashlib.sha256()
+        self._size = 0
+        self._tmp_path = ""
+        self._file: Optional[BinaryIO] = None
+
+    def __enter__(self) -> "AtomicReport":
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        fd, self._tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(self.path)}.")
+        self._file = os.fdopen(fd, "wb", buffering=WRITE_BUFFER_BYTES)
+        return self
+
+    def write(self, text: str) -> None:
+        data = text.encode(self.encoding)
+        self._digest.update(data)
+        self._size += len(data)
+        self._file.write(data)
+
+    def writelines(self, lines: Iterable[str]) -> None:
+        for line in lines:
+            self.write(line)
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        try:
+            self._file.close()
+            if exc_type is None and not self._unchanged():
+                self._replace()
+        finally:
+            if os.path.exists(self._tmp_path):
+                os.unlink(self._tmp_path)
+
+    def _unchanged(self) -> bool:
+        try:
+            if os.path.getsize(self.path) != self._size:
+                return False
+        except OSError:
+            return False
+        unchanged = file_sha256(self.path) == self._digest.hexdigest()
+        if unchanged:
+            profiling.count("reports", "unchanged")
+        return unchanged
+
+    def _replace(self) -> None:
+        _replace_keeping_mode(self._tmp_path, self.path)
+        self.changed = True
+        profiling.count("reports", "written")
+        profiling.count("reports", "bytes_written", self._size)
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+Content-addressed, compressed history of the datasources/ snapshots.
+
+The store under datasources/store/ replaces committing a fresh copy of every
+snapshot on each run:
+
+- objects/<sha[:2]>/<sha>: one object per distinct version of a snapshot,
+  named by the SHA-256 of its text (the hash sources_manifest.json records).
+  A JSON header line gives the codec and, for a delta, the base object; the
+  compressed payload follows. A new version is stored as a line delta against
+  the previous version of the same source whenever that is smaller, so a
+  day's change to the 1 MB landscape.yml costs a few hundred bytes.
+- runs/<NNNNNN>.json: one manifest per recorded run, mapping each source and
+  PCC snapshot to its object and file name. A run identical to the latest one
+  is not recorded again.
+
+Objects are compressed with xz (stdlib lzma) by default, so every checkout can
+read the store; the audit's --snapshot-codec zstd uses zstd instead when the
+zstandard package is installed. Delta chains are capped at MAX_DELTA_DEPTH, and every text loaded is
+checked against its hash. Texts are stored as the audit reads them, with
+newlines normalised, so a checked-out file may differ from the download in its
+line endings only.
+
+    python scripts/snapshot_store.py list
+    python scripts/snapshot_store.py checkout [RUN]   # restore datasources/ as of a run
+    python scripts/snapshot_store.py verify
+"""
+import argparse
+import difflib
+import json
+import lzma
+import os
+import sys
+import tempfile
+import time
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
+
+try:
+    import zstandard  # type: ignore
+except Exception:
+    zstandard = None
+
+from source_fetch import sha256_text
+
+DATASOURCES_DIR = os.path.join(os.getcwd(), "datasources")
+STORE_DIR = os.path.join(DATASOURCES_DIR, "store")
+STORE_FORMAT = 1
+
+CODEC_XZ = "xz"
+CODEC_ZSTD = "zstd"
+CODECS = (CODEC_XZ, CODEC_ZSTD)
+XZ_PRESET = 9 | lzma.PRESET_EXTREME
+ZSTD_LEVEL = 19
+# Deltas stacked on one full object at most; bounds the work to load a version
+MAX_DELTA_DEPTH = 32
+
+# A delta is a list of ops: [start, end] copies base lines, a string is inserted as is
+DeltaOp = Union[List[int], str]
+
+
+class ObjectHeader(NamedTuple):
+    codec: str
+    # Object this one is a delta against; empty for a full object
+    base: str
+    # Number of deltas between this object and a full one
+    depth: int
+    size: int
+
+
+class Run(NamedTuple):
+    number: int
+    recorded_at: str
+    # {name: {"sha256": ..., "filename": ...}} for every source and PCC snapshot
+    entries: Dict[str, Dict[str, str]]
+
+
+def line_delta(base: str, text: str) -> List[DeltaOp]:
+    base_lines = base.splitlines(keepends=True)
+    lines = text.splitlines(keepends=True)
+    ops: List[DeltaOp] = []
+    for tag, i1, i2, j1, j2 in difflib.SequenceMatcher(None, base_lines, lines).get_opcodes():
+        if tag == "equal":
+            ops.append([i1, i2])
+        elif j2 > j1:
+            ops.append("".join(lines[j1:j2]))
+    return ops
+
+
+def apply_delta(base: str, ops: List[DeltaOp]) -> str:
+    base_lines = base.splitlines(keepends=True)
+    return "".join(op if isinstance(op, str) else "".join(base_lines[op[0]:op[1]]) for op in ops)
+
+
+def require_codec(codec: str) -> None:
+    if codec not in CODECS:
+        raise ValueError(f"unknown codec {codec!r}; expected one of {', '.join(CODECS)}")
+    if codec == CODEC_ZSTD and zstandard is None:
+        raise RuntimeError("The zstd codec needs the zstandard package. Install with: pip install zstandard")
+
+
+def compress(codec: str, data: bytes) -> bytes:
+    require_codec(codec)
+    if codec == CODEC_ZSTD:
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+    return lzma.compress(data, preset=XZ_PRESET)
+
+
+def decompress(codec: str, data: bytes) -> bytes:
+    require_codec(codec)
+    if codec == CODEC_ZSTD:
+        return zstandard.ZstdDecompressor().decompress(data)
+    return lzma.decompress(data)
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=f".{os.path.basename(path)}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+class SnapshotStore:
+    def __init__(self, root: str = STORE_DIR, codec: str = CODEC_XZ) -> None:
+        self.root = root
+        self.codec = codec
+
+    def object_path(self, sha: str) -> str:
+        return os.path.join(self.root, "objects", sha[:2], sha)
+
+    def run_path(self, number: int) -> str:
+        return os.path.join(self.root, "runs", f"{number:06d}.json")
+
+    def has(self, sha: str) -> bool:
+        return os.path.exists(self.object_path(sha))
+
+    def _read(self, sha: str) -> Tuple[ObjectHeader, bytes]:
+        try:
+            with open(self.object_path(sha), "rb") as f:
+                header = ObjectHeader(**json.loads(f.readline()))
+                return header, decompress(header.codec, f.read())
+        except FileNotFoundError:
+            raise KeyError(f"object {sha} is not in the snapshot store at {self.root}") from None
+
+    def header(self, sha: str) -> ObjectHeader:
+        with open(self.object_path(sha), "rb") as f:
+            return ObjectHeader(**json.loads(f.readline()))
+
+    def put(self, text: str, base: str = "") -> str:
+        """
+        Store `text` and return its hash. With `base` (the hash of an earlier
+        version of the same file), it is stored as a delta when that is smaller.
+        """
+        sha = sha256_text(text)
+        if self.has(sha):
+            return sha
+        require_codec(self.codec)
+        data = text.encode("utf-8")
+        header = ObjectHeader(self.codec, "", 0, len(data))
+        payload = compress(self.codec, data)
+        if base and base != sha and self.has(base):
+            base_depth = self.header(base).depth
+            if base_depth < MAX_DELTA_DEPTH:
+                ops = line_delta(self.get(base), text)
+                delta = compress(self.codec, json.dumps(ops, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+                if len(delta) < len(payload):
+                    header, payload = ObjectHeader(self.codec, base, base_depth + 1, len(data)), delta
+        line = json.dumps(header._asdict(), sort_keys=True, separators=(",", ":")).encode("utf-8") + b"\n"
+        _write_atomic(self.object_path(sha), line + payload)
+        return sha
+
+    def get(self, sha: str) -> str:
+        """
+        The text stored under `sha`, rebuilt through its delta chain and verified.
+        """
+        chain: List[Tuple[ObjectHeader, bytes]] = []
+        current = sha
+        while True:
+            header, payload = self._read(current)
+            chain.append((header, payload))
+            if not header.base:
+                break
+            current = header.base
+        text = chain[-1][1].decode("utf-8")
+        for header, payload in reversed(chain[:-1]):
+            text = apply_delta(text, json.loads(payload))
+        if sha256_text(text) != sha:
+            raise ValueError(f"object {sha} is corrupt: its content hashes differently")
+        return text
+
+    def runs(self) -> List[int]:
+        runs_dir = os.path.join(self.root, "runs")
+        if not os.path.isdir(runs_dir):
+            return []
+        return sorted(int(name[:-5]) for name in os.listdir(runs_dir) if name.endswith(".json") and name[:-5].isdigit())
+
+    def run(self, number: int) -> Run:
+        try:
+            with open(self.run_path(number), "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            raise KeyError(f"run {number} is not in the snapshot store at {self.root}") from None
+        return Run(data["run"], data["recorded_at"], data["entries"])
+
+    def latest(self) -> Optional[Run]:
+        runs = self.runs()
+        return self.run(runs[-1]) if runs else None
+
+    def record(self, files: Dict[str, Tuple[str, str]]) -> Optional[Run]:
+        """
+        Store {name: (filename, text)} as a new run, each text as a delta against
+        the same name's version in the latest run. Returns None, recording
+        nothing, when every file is unchanged since that run.
+        """
+        latest = self.latest()
+        previous = latest.entries if latest else {}
+        entries: Dict[str, Dict[str, str]] = {}
+        for name, (filename, text) in files.items():
+            base = (previous.get(name) or {}).get("sha256", "")
+            entries[name] = {"filename": filename, "sha256": self.put(text, base)}
+        if latest and entries == latest.entries:
+            return None
+        run = Run(latest.number + 1 if latest else 1, time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()), entries)
+        manifest = {"format": STORE_FORMAT, "run": run.number, "recorded_at": run.recorded_at, "entries": entries}
+        _write_atomic(self.run_path(run.number), (json.dumps(manifest, indent=2, sort_keys=True) + "\n").encode("utf-8"))
+        return run
+
+    def checkout(self, number: int, dest_dir: str = DATASOURCES_DIR) -> List[str]:
+        """
+        Write a run's files into `dest_dir`. Files already holding that content
+        are left untouched. Returns the paths written.
+        """
+        written: List[str] = []
+        for entry in self.run(number).entries.values():
+            path = os.path.join(dest_dir, entry["filename"])
+            if os.path.exists(path):
+                with open(path, "r", encoding="utf-8") as f:
+                    if sha256_text(f.read()) == entry["sha256"]:
+                        continue
+            _write_atomic(path, self.get(entry["sha256"]).encode("utf-8"))
+            written.append(path)
+        return written
+
+    def size_bytes(self) -> int:
+        total = 0
+        for dirpath, _, filenames in os.walk(self.root):
+            total += sum(os.path.getsize(os.path.join(dirpath, name)) for name in filenames)
+        return total
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Inspect and restore the datasources/ snapshot history.")
+    parser.add_argument("--store", default=STORE_DIR, help="Store directory (default: datasources/store)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("list", help="List the recorded runs")
+    checkout = commands.add_parser("checkout", help="Restore the snapshots of a run into datasources/")
+    checkout.add_argument("run", nargs="?", type=int, help="Run number (default: the latest run)")
+    checkout.add_argument("--dest", default=DATASOURCES_DIR, help="Directory to write to (default: datasources)")
+    commands.add_parser("verify", help="Load every object of every run and check its hash")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    store = SnapshotStore(args.store)
+    runs = store.runs()
+    if args.command == "list":
+        for number in runs:
+            run = store.run(number)
+            print(f"{run.number:6d}  {run.recorded_at}  {', '.join(sorted(run.entries))}")
+        print(f"{len(runs)} runs, {store.size_bytes() / 1024:.1f} KiB in {store.root}", file=sys.stderr)
+    elif args.command == "checkout":
+        if not runs:
+            print(f"No runs recorded in {store.root}; nothing to check out", file=sys.stderr)
+            return
+        number = runs[-1] if args.run is None else args.run
+        written = store.checkout(number, args.dest)
+        print(f"Checked out run {number}: {len(written)} files written, the rest already up to date", file=sys.stderr)
+    elif args.command == "verify":
+        shas = {entry["sha256"] for number in runs for entry in store.run(number).entries.values()}
+        for sha in sorted(shas):
+            store.get(sha)
+        print(f"Verified {len(shas)} objects across {len(runs)} runs", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Concurrent fetch layer for the audited datasources.
+
+All sources are fetched at the same time over one shared connection pool, so a
+cold run takes about as long as the slowest source rather than the sum of all
+of them.
+
+Each snapshot under datasources/ has an entry in a sidecar manifest recording
+its URL, ETag, Last-Modified and SHA-256. Three modes decide when the network
+is used:
+
+- local (default): reuse snapshots that exist, fetch only the missing ones
+- refresh: revalidate every snapshot with If-None-Match/If-Modified-Since;
+  a 304 keeps the local file untouched
+- offline: never use the network; a missing snapshot is an error
+
+In every mode, a snapshot missing from disk is first asked of an optional
+`restore` hook (the audit passes one backed by the snapshot store). A restored
+snapshot is written back to its path and then treated as if it had been there.
+"""
+import email.utils
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+import profiling
+
+DEFAULT_TIMEOUT_SECONDS = 60
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF_SECONDS = 1.0
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+# Statuses whose Retry-After header is honoured instead of the backoff
+RETRY_AFTER_STATUS_CODES = {429, 503}
+# Longest Retry-After waited for; a longer one is capped rather than stalling the run
+MAX_RETRY_AFTER_SECONDS = 60.0
+USER_AGENT = "project-status-audit/0.1 (+github actions)"
+MANIFEST_FILENAME = "sources_manifest.json"
+
+MODE_LOCAL = "local"
+MODE_REFRESH = "refresh"
+MODE_OFFLINE = "offline"
+
+# Returns the text to restore a missing snapshot with, or None if it has no copy
+RestoreFn = Callable[["FetchSpec"], Optional[str]]
+
+
+class FetchSpec(NamedTuple):
+    name: str
+    url: str
+    path: str
+    timeout: float = DEFAULT_TIMEOUT_SECONDS
+
+
+class FetchResult(NamedTuple):
+    text: str
+    sha256: str
+
+
+def sha256_text(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def manifest_path_for(specs: List[FetchSpec]) -> str:
+    return os.path.join(os.path.dirname(specs[0].path), MANIFEST_FILENAME)
+
+
+def load_manifest(path: str) -> Dict[str, Dict[str, str]]:
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def save_manifest(path: str, manifest: Dict[str, Dict[str, str]]) -> None:
+    # Stable key order and no timestamps, so an unchanged source gives no diff
+    text = json.dumps(manifest, indent=2, sort_keys=True) + "\n"
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            if f.read() == text:
+                return
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+def build_session(pool_size: int) -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"User-Agent": USER_AGENT})
+    return session
+
+
+def retry_after_seconds(resp: Optional[requests.Response]) -> Optional[float]:
+    """
+    The wait a response asks for in its Retry-After header, given as seconds or
+    as an HTTP date, capped at MAX_RETRY_AFTER_SECONDS. None without a usable header.
+    """
+    value = resp.headers.get("Retry-After", "").strip() if resp is not None else ""
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            when = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        seconds = (when - datetime.now(timezone.utc)).total_seconds()
+    return min(max(0.0, seconds), MAX_RETRY_AFTER_SECONDS)
+
+
+def request_with_retries(
+    session: requests.Session,
+    spec: FetchSpec,
+    headers: Dict[str, str],
+    retries: int = DEFAULT_RETRIES,
+    backoff: float = DEFAULT_BACKOFF_SECONDS,
+) -> requests.Response:
+    """
+    GET spec.url, retrying connection errors, timeouts and retryable HTTP statuses
+    with exponential backoff, or after the Retry-After delay of a 429/503 that
+    sends one. Other HTTP errors are raised immediately.
+    """
+    attempt = 0
+    while True:
+        start = time.perf_counter()
+        try:
+            resp = session.get(spec.url, headers=headers, timeout=spec.timeout)
+            profiling.observe("sources", time.perf_counter() - start)
+            profiling.count(spec.name, "network_requests")
+            resp.raise_for_status()
+            return resp
+        except (requests.ConnectionError, requests.Timeout, requests.HTTPError) as err:
+            status = err.response.status_code if err.response is not None else None
+            if attempt >= retries or (status is not None and status not in RETRY_STATUS_CODES):
+                raise
+            profiling.count(spec.name, "retries")
+            delay = retry_after_seconds(err.response) if status in RETRY_AFTER_STATUS_CODES else None
+            time.sleep(backoff * (2 ** attempt) if delay is None else delay)
+            attempt += 1
+
+
+def sync_source(
+    session: requests.Session,
+    spec: FetchSpec,
+    entry: Dict[str, str],
+    mode: str,
+    restore: Optional[RestoreFn] = None,
+) -> Tuple[FetchResult, Optional[Dict[str, str]]]:
+    """
+    Bring one snapshot up to date according to mode.
+    Returns the snapshot content and, when the network was used, the manifest
+    entry describing it; None when the local snapshot was reused as is.
+    """
+    local_text = None
+    local_sha = ""
+    if os.path.exists(spec.path):
+        with open(spec.path, "r", encoding="utf-8") as f:
+            local_text = f.read()
+        local_sha = sha256_text(local_text)
+    elif restore is not None:
+        local_text = restore(spec)
+        if local_text is not None:
+            with open(spec.path, "w", encoding="utf-8") as f:
+                f.write(local_text)
+            local_sha = sha256_text(local_text)
+            profiling.count(spec.name, "snapshot_restored")
+
+    if local_text is not None and mode != MODE_REFRESH:
+        # A snapshot replaced outside this tool keeps its old entry; refresh
+        # sees the hash mismatch and skips the stale validators
+        profiling.count(spec.name, "snapshot_reused")
+        return FetchResult(local_text, local_sha), None
+    if mode == MODE_OFFLINE:
+        raise FileNotFoundError(f"{spec.path} is missing, has no recorded copy to restore, and offline mode forbids fetching it")
+
+    headers: Dict[str, str] = {}
+    validated = local_text is not None and entry.get("url") == spec.url and entry.get("sha256") == local_sha
+    if validated:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+    resp = request_with_retries(session, spec, headers)
+    if resp.status_code == 304 and validated:
+        profiling.count(spec.name, "not_modified")
+        return FetchResult(local_text, local_sha), entry
+
+    profiling.count(spec.name, "bytes_downloaded", len(resp.content))
+    text = resp.text
+    sha = sha256_text(text)
+    if sha != local_sha:
+        with open(spec.path, "w", encoding="utf-8") as f:
+            f.write(text)
+    new_entry = {"url": spec.url, "sha256": sha}
+    if resp.headers.get("ETag"):
+        new_entry["etag"] = resp.headers["ETag"]
+    if resp.headers.get("Last-Modified"):
+        new_entry["last_modified"] = resp.headers["Last-Modified"]
+    return FetchResult(text, sha), new_entry
+
+
+def fetch_all(
+    specs: List[FetchSpec],
+    mode: str = MODE_LOCAL,
+    restore: Optional[RestoreFn] = None,
+) -> Dict[str, FetchResult]:
+    """
+    Sync every spec concurrently and return {spec.name: FetchResult}.
+    The manifest is rewritten once all sources have settled, and only when at
+    least one of them was synced over the network.
+    """
+    if not specs:
+        return {}
+    for spec in specs:
+        os.makedirs(os.path.dirname(spec.path), exist_ok=True)
+    manifest_path = manifest_path_for(specs)
+    manifest = load_manifest(manifest_path)
+    with build_session(len(specs)) as session, ThreadPoolExecutor(max_workers=len(specs)) as pool:
+        futures = {
+            spec.name: pool.submit(sync_source, session, spec, dict(manifest.get(spec.name) or {}), mode, restore)
+            for spec in specs
+        }
+        results: Dict[str, FetchResult] = {}
+        synced = False
+        for name, fut in futures.items():
+            result, entry = fut.result()
+            results[name] = result
+            if entry is not None:
+                manifest[name] = entry
+                synced = True
+    if synced:
+        save_manifest(manifest_path, manifest)
+    return results
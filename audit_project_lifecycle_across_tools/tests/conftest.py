@@ -0,0 +1,115 @@
+"""
+Shared fixtures. The scripts are plain modules imported by name, so their
+directory goes on sys.path, as it is when a script runs.
+"""
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Iterator, List, NamedTuple, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+PROJECT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(PROJECT_DIR, "scripts"))
+
+# (status, headers, body) returned by a stub handler
+StubResponse = Tuple[int, Dict[str, str], bytes]
+
+
+class StubRequest(NamedTuple):
+    method: str
+    path: str
+    # Query parameters, one value each
+    query: Dict[str, str]
+    headers: Dict[str, str]
+
+
+class StubServer:
+    """
+    Local HTTP server standing in for an upstream API. Every request is
+    recorded in `requests`, in arrival order, and answered by `handler`.
+    """
+
+    def __init__(self) -> None:
+        self.requests: List[StubRequest] = []
+        self.handler: Callable[[StubRequest], StubResponse] = lambda request: (404, {}, b"")
+        self._lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                url = urlsplit(self.path)
+                request = StubRequest(
+                    "GET",
+                    url.path,
+                    {key: values[0] for key, values in parse_qs(url.query).items()},
+                    dict(self.headers.items()),
+                )
+                with stub._lock:
+                    stub.requests.append(request)
+                status, headers, body = stub.handler(request)
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def sequence(self, *responses: StubResponse) -> None:
+        """
+        Answer with `responses` in turn, repeating the last one.
+        """
+        remaining = list(responses)
+
+        def handler(request: StubRequest) -> StubResponse:
+            with self._lock:
+                return remaining.pop(0) if len(remaining) > 1 else remaining[0]
+
+        self.handler = handler
+
+
+@pytest.fixture
+def stub_server() -> Iterator[StubServer]:
+    stub = StubServer()
+    # A short poll interval keeps shutdown() from waiting half a second per test
+    thread = threading.Thread(target=stub.server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
+    thread.start()
+    try:
+        yield stub
+    finally:
+        stub.server.shutdown()
+        stub.server.server_close()
+
+
+@pytest.fixture(scope="session")
+def recorded_text() -> Callable[[str], str]:
+    """
+    Look up a snapshot by source name in the latest run of the committed
+    datasources/store/, so the tests see the same data in a fresh clone.
+    """
+    from snapshot_store import SnapshotStore
+
+    store = SnapshotStore(os.path.join(PROJECT_DIR, "datasources", "store"))
+    run = store.latest()
+    if run is None:
+        pytest.skip("no run recorded in datasources/store/")
+    return lambda name: store.get(run.entries[name]["sha256"])
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> List[float]:
+    """
+    Record the delays of time.sleep instead of waiting, so backoff is instant.
+    """
+    recorded: List[float] = []
+    monkeypatch.setattr("time.sleep", recorded.append)
+    return recorded
@@ -0,0 +1,67 @@
+import os
+import sys
+
+import pytest
+import yaml
+
+import audit_landscape_status as audit
+from alias_index import AliasIndex
+
+# The previous alias generator lives with its benchmark; it is the reference the memoised one must match
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "benchmarks"))
+
+from bench_aliases import legacy_generate_aliases  # noqa: E402
+
+NAMES = [
+    ("Kubernetes", ""),
+    ("Metal³", ""),
+    ("Cloud Custodian", "cloud-custodian"),
+    ("Open Policy Agent (OPA)", "open-policy-agent-opa"),
+    ("KubeEdge", ""),
+    ("Container Network Interface (CNI)", ""),
+    ("Flatcar Container Linux", ""),
+    ("in-toto", ""),
+    ("Operator Framework", ""),
+    ("CloudEvents Specification", ""),
+    ("Network Service Mesh / NSM", ""),
+    ("Crossplane & Friends", ""),
+    ("Café_Project", ""),
+    ("", ""),
+]
+
+
+@pytest.mark.parametrize("name, lfx_slug", NAMES)
+def test_aliases_match_the_previous_generator(name, lfx_slug):
+    aliases = audit.generate_aliases_from_landscape(name, lfx_slug)
+
+    assert len(aliases) == len(set(aliases))
+    assert set(aliases) == set(legacy_generate_aliases(name, {"lfx_slug": lfx_slug}))
+    # Memoised: the same tuple comes back for the same arguments
+    assert audit.generate_aliases_from_landscape(name, lfx_slug) is aliases
+
+
+def test_status_maps_and_index_match_the_previous_generator_on_the_recorded_snapshots(recorded_text, monkeypatch):
+    sources = audit.registered_sources()
+    texts = {source.name: recorded_text(source.name) for source in sources}
+    maps = {source.name: source.build_map(texts[source.name]) for source in sources}
+
+    monkeypatch.setattr(
+        audit, "generate_aliases_from_landscape",
+        lambda name, lfx_slug="": legacy_generate_aliases(name, {"lfx_slug": lfx_slug}),
+    )
+    legacy_maps = {source.name: source.build_map(texts[source.name]) for source in sources}
+    monkeypatch.undo()
+
+    assert maps == legacy_maps
+
+    # One pass over the index gives each source the status probing its own map would
+    index = AliasIndex.build(maps)
+    expected = audit.collect_pcc_expected_statuses(yaml.safe_load(recorded_text("pcc")))
+    assert expected
+    for name, _, _ in expected:
+        query_keys = audit.generate_query_keys(name)
+        probed = []
+        for status_map in legacy_maps.values():
+            key = next((k for k in query_keys if status_map.get(k)), "")
+            probed.append((status_map[key] if key else "", key))
+        assert index.resolve_matches(query_keys) == probed, name
@@ -0,0 +1,93 @@
+import http.client
+import json
+import threading
+
+import pytest
+
+import audit_landscape_status as audit
+import audit_server
+from snapshot_store import SnapshotStore
+from source_fetch import MANIFEST_FILENAME
+
+MANIFEST = '{"landscape": {"sha256": "recorded by the last network sync"}}\n'
+
+
+@pytest.fixture
+def datasources(tmp_path, monkeypatch, recorded_text):
+    """
+    A datasources/ directory holding the recorded snapshots and a manifest.
+    """
+    for source in audit.registered_sources():
+        (tmp_path / source.filename).write_text(recorded_text(source.name), encoding="utf-8")
+    (tmp_path / "pcc_projects.yaml").write_text(recorded_text("pcc"), encoding="utf-8")
+    (tmp_path / MANIFEST_FILENAME).write_text(MANIFEST, encoding="utf-8")
+    monkeypatch.setattr(audit, "DATASOURCES_DIR", str(tmp_path))
+    monkeypatch.setattr(audit, "PCC_YAML_PATH", str(tmp_path / "pcc_projects.yaml"))
+    return tmp_path
+
+
+@pytest.fixture
+def connection(datasources):
+    service = audit_server.AuditService([], None, False, audit.FUZZY_MIN_SCORE)
+    server = audit_server.make_server(service, "127.0.0.1", 0)
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
+    thread.start()
+    conn = http.client.HTTPConnection("127.0.0.1", server.server_address[1], timeout=30)
+    try:
+        yield conn
+    finally:
+        conn.close()
+        server.shutdown()
+        server.server_close()
+
+
+def request(conn, method, path, headers={}):
+    conn.request(method, path, headers=headers)
+    response = conn.getresponse()
+    return response.status, response.read(), response.getheader("ETag")
+
+
+def test_a_matching_etag_is_answered_304(connection):
+    status, body, etag = request(connection, "GET", "/projects?anomaly=true")
+    assert status == 200 and json.loads(body)
+
+    status, body, _ = request(connection, "GET", "/projects?anomaly=true", {"If-None-Match": etag})
+
+    assert (status, body) == (304, b"")
+
+
+def test_reload_reports_a_missing_pcc_snapshot_as_500(connection, datasources):
+    (datasources / "pcc_projects.yaml").unlink()
+
+    status, body, _ = request(connection, "POST", "/reload")
+
+    assert status == 500
+    assert "pcc_projects.yaml not found" in json.loads(body)["error"]
+    # Same connection, still served by the previous index
+    status, body, _ = request(connection, "GET", "/health")
+    assert status == 200 and json.loads(body)["generation"] == 1
+
+
+def test_loading_never_writes_the_sources_manifest(connection, datasources):
+    status, body, _ = request(connection, "POST", "/reload")
+
+    assert status == 200 and json.loads(body)["generation"] == 2
+    assert (datasources / MANIFEST_FILENAME).read_text(encoding="utf-8") == MANIFEST
+
+
+def test_a_fresh_clone_loads_offline_from_the_snapshot_store(tmp_path, monkeypatch, recorded_text):
+    # Only what git checks out: the PCC snapshot and the store, no raw source files
+    sources = audit.registered_sources()
+    SnapshotStore(str(tmp_path / "store")).record(
+        {source.name: (source.filename, recorded_text(source.name)) for source in sources}
+    )
+    (tmp_path / "pcc_projects.yaml").write_text(recorded_text("pcc"), encoding="utf-8")
+    monkeypatch.setattr(audit, "DATASOURCES_DIR", str(tmp_path))
+    monkeypatch.setattr(audit, "PCC_YAML_PATH", str(tmp_path / "pcc_projects.yaml"))
+
+    index = audit_server.AuditIndex.load([], None, fuzzy=False)
+
+    assert index.health()["foundations"]["cncf"] > 0
+    for source in sources:
+        assert (tmp_path / source.filename).read_text(encoding="utf-8") == recorded_text(source.name)
+    assert not (tmp_path / MANIFEST_FILENAME).exists()
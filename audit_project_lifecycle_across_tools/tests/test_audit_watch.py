@@ -0,0 +1,56 @@
+import pytest
+
+import audit_landscape_status as audit
+
+
+def scripted_watcher(steps):
+    """
+    A FileWatcher whose wait() runs the next step (which edits files) and
+    reports the paths it returns as changed.
+    """
+
+    class Watcher:
+        def __init__(self, paths):
+            pass
+
+        def wait(self, interval):
+            return steps.pop(0)()
+
+    return Watcher
+
+
+def test_missing_pcc_snapshot_exits_with_an_error(capsys):
+    with pytest.raises(SystemExit) as exc:
+        audit.main(["--offline", "--foundation", "no-such-foundation"])
+
+    assert exc.value.code == 1
+    assert "pcc_projects.no-such-foundation.yaml not found" in capsys.readouterr().err
+
+
+def test_watch_keeps_running_when_the_pcc_snapshot_disappears(tmp_path, monkeypatch, capsys):
+    pcc = tmp_path / "pcc_projects.yaml"
+    pcc.write_text("v1", encoding="utf-8")
+    target = audit.default_target()._replace(pcc_path=str(pcc))
+
+    def delete():
+        pcc.unlink()
+        return [str(pcc)]
+
+    def restore():
+        pcc.write_text("v2", encoding="utf-8")
+        return [str(pcc)]
+
+    monkeypatch.setattr(audit, "FileWatcher", scripted_watcher([delete, restore]))
+    audited = []
+
+    def audit_targets(stale, dirty):
+        audited.append(audit.read_pcc_text(stale[0].pcc_path))
+        # Ends the watch once it has survived the missing file
+        raise KeyboardInterrupt
+
+    audit.watch(0, [], [target], {}, {}, None, audit_targets)
+
+    assert audited == ["v2"]
+    err = capsys.readouterr().err
+    assert "Audit failed; reports left as they were:" in err and "not found" in err
+    assert "Stopped watching" in err
@@ -0,0 +1,93 @@
+import json
+
+import pytest
+
+import audit_landscape_status as audit
+
+SOURCES = [audit.SOURCE_REGISTRY["landscape"], audit.SOURCE_REGISTRY["clomonitor"]]
+
+# name, PCC status, landscape status, clomonitor status, fuzzy scores -> anomaly mask, reasons.
+# Mask bits per source, in source order: missing, mismatch, fuzzy.
+TABLE = [
+    ("Zeta", "", "sandbox", "sandbox", {}, 0b010010, ("mismatch:landscape", "mismatch:clomonitor")),
+    ("Epsilon", "archived", "incubating", "archived", {}, 0b000010, ("mismatch:landscape",)),
+    ("Delta", "sandbox", "sandbox", "", {"landscape": 0.81234}, 0b001100, ("fuzzy:landscape", "missing:clomonitor")),
+    ("Gamma", "incubating", "incubating", "graduated", {}, 0b010000, ("mismatch:clomonitor",)),
+    ("beta", "sandbox", "", "sandbox", {}, 0b000001, ("missing:landscape",)),
+    ("Alpha", "graduated", "graduated", "graduated", {}, 0, ()),
+    ("Omega", "forming", "", "", {}, 0b001001, ("missing:landscape", "missing:clomonitor")),
+]
+
+
+def row(name, pcc_status, landscape, clomonitor, fuzzy):
+    statuses = {"landscape": landscape, "clomonitor": clomonitor}
+    matched = {src: name.lower() if status else "" for src, status in statuses.items()}
+    return audit.AuditRow(name, pcc_status, statuses, matched, fuzzy, *audit.classify_statuses(pcc_status, statuses, fuzzy))
+
+
+@pytest.fixture
+def classified():
+    return audit.classify_rows(row(*case[:5]) for case in TABLE)
+
+
+@pytest.mark.parametrize("case", TABLE, ids=[case[0] for case in TABLE])
+def test_anomaly_mask_and_reasons(case):
+    name, pcc_status, landscape, clomonitor, fuzzy, mask, reasons = case
+
+    classified_row = row(name, pcc_status, landscape, clomonitor, fuzzy)
+
+    assert classified_row.anomaly_mask == mask
+    assert classified_row.reasons == reasons
+
+
+def test_anomaly_bits_are_laid_out_per_source():
+    assert audit.anomaly_bit(audit.ANOMALY_MISSING, 0) == 1
+    assert audit.anomaly_bit(audit.ANOMALY_FUZZY, 0) == 4
+    assert audit.anomaly_bit(audit.ANOMALY_MISMATCH, 1) == 16
+
+
+def test_rows_are_ordered_by_status_then_name(classified):
+    # Unknown PCC statuses sort last; names compare case-insensitively
+    assert [r.name for r in classified.rows] == ["Alpha", "Gamma", "beta", "Delta", "Omega", "Epsilon", "Zeta"]
+    assert [r.name for r in classified.anomalies] == ["Gamma", "beta", "Delta", "Omega", "Epsilon", "Zeta"]
+    assert {status: [r.name for r in rows] for status, rows in classified.by_status.items()} == {
+        "graduated": ["Alpha"],
+        "incubating": ["Gamma"],
+        "sandbox": ["beta", "Delta"],
+        "forming": ["Omega"],
+        "archived": ["Epsilon"],
+    }
+
+
+def test_records_have_fixed_columns_in_report_order(classified, tmp_path):
+    target = audit.default_target()._replace(all_path=str(tmp_path / "all_statuses.md"))
+
+    audit.write_audit_records(classified, SOURCES, target)
+
+    with open(target.records_path, encoding="utf-8") as f:
+        records = [json.loads(line) for line in f]
+    assert [r["project"] for r in records] == [r.name for r in classified.rows]
+    assert all(list(r) == [
+        "foundation", "project", "pcc_status", "anomaly", "reasons",
+        "landscape_status", "landscape_key", "landscape_confidence",
+        "clomonitor_status", "clomonitor_key", "clomonitor_confidence",
+    ] for r in records)
+    assert records[0] == {
+        "foundation": "cncf",
+        "project": "Alpha",
+        "pcc_status": "graduated",
+        "anomaly": False,
+        "reasons": [],
+        "landscape_status": "graduated",
+        "landscape_key": "alpha",
+        "landscape_confidence": 1.0,
+        "clomonitor_status": "graduated",
+        "clomonitor_key": "alpha",
+        "clomonitor_confidence": 1.0,
+    }
+    delta = records[3]
+    assert delta["anomaly"] is True
+    assert delta["reasons"] == ["fuzzy:landscape", "missing:clomonitor"]
+    assert delta["landscape_confidence"] == 0.8123
+    assert (delta["clomonitor_status"], delta["clomonitor_key"], delta["clomonitor_confidence"]) == (None, None, None)
+    assert records[-1]["pcc_status"] is None
@@ -0,0 +1,47 @@
+import os
+import sys
+
+import pytest
+
+import audit_landscape_status as audit
+
+# The previous parser lives with its benchmark; it is the reference the backends must match
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "benchmarks"))
+
+from bench_devstats import legacy_build_devstats_status_map  # noqa: E402
+
+BACKENDS = [
+    "html.parser",
+    pytest.param("lxml", marks=pytest.mark.skipif(audit.lxml_html is None, reason="lxml not installed")),
+]
+
+PAGE = """
+<table>
+  <tr><th>Graduated</th></tr>
+  <tr><td><a href="/k8s">Kubernetes</a></td><td><a href="/p">Prometheus</a></td></tr>
+  <tr><td>Incubating</td></tr>
+  <tr><td><a href="/x"> </a><a href="/b">Backstage</a></td></tr>
+  <tr><td>Not a status</td></tr>
+  <tr><td><a href="/c">Kubernetes</a></td></tr>
+</table>
+"""
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_rows_take_the_status_of_the_section_above(backend):
+    status_map = audit.build_devstats_status_map(PAGE, backend=backend)
+
+    assert status_map["kubernetes"] == "graduated"
+    assert status_map["prometheus"] == "graduated"
+    assert status_map["backstage"] == "incubating"
+    assert list(status_map.items()) == list(legacy_build_devstats_status_map(PAGE).items())
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_backends_match_the_previous_parser_on_the_recorded_snapshot(recorded_text, backend):
+    html = recorded_text("devstats")
+
+    # Same keys, same statuses and same insertion order
+    assert list(audit.build_devstats_status_map(html, backend=backend).items()) == list(
+        legacy_build_devstats_status_map(html).items()
+    )
@@ -0,0 +1,157 @@
+import calendar
+import json
+
+import pytest
+import requests
+
+import fetch_pcc_projects as fetch
+from pcc_client import TokenBucket, build_session
+from pcc_store import ProjectStore
+
+CNCF = frozenset([fetch.FOUNDATION_ID_CNCF])
+
+
+def catalogue(n):
+    return [
+        {
+            "ID": f"p{i:04d}",
+            "Name": f"Project {i}",
+            "Category": "Sandbox",
+            "Status": "Active",
+            "UpdatedAt": "2026-10-01T00:00:00Z",
+            "Foundation": {"ID": fetch.FOUNDATION_ID_CNCF},
+        }
+        for i in range(n)
+    ]
+
+
+def paginated(projects, fail_at=None):
+    def handler(request):
+        offset = int(request.query["offset"])
+        if offset == fail_at:
+            return 404, {}, b""
+        limit = int(request.query["limit"])
+        since = request.query.get(fetch.MODIFIED_SINCE_PARAM)
+        matching = [p for p in projects if not since or p["UpdatedAt"] >= since]
+        body = {"Data": matching[offset:offset + limit], "Metadata": {"TotalSize": len(matching)}}
+        return 200, {"Content-Type": "application/json"}, json.dumps(body).encode("utf-8")
+
+    return handler
+
+
+@pytest.fixture
+def store(stub_server, tmp_path, monkeypatch):
+    monkeypatch.setattr(fetch, "API_URL", f"{stub_server.url}/projects")
+    monkeypatch.setattr(fetch, "CHECKPOINT_DIR", str(tmp_path / "pages"))
+    store = ProjectStore(str(tmp_path / "store.sqlite3"))
+    yield store
+    store.close()
+
+
+def sync_full(store, no_resume=False):
+    with build_session({}, 1) as session:
+        return fetch.sync_full(session, TokenBucket(0), store, 1, no_resume, CNCF)
+
+
+def interrupted_crawl(stub_server, store, projects):
+    # Pages 0 and 100 are checkpointed, then offset 200 fails without a retry
+    stub_server.handler = paginated(projects, fail_at=200)
+    with pytest.raises(requests.HTTPError):
+        sync_full(store)
+    stub_server.handler = paginated(projects)
+    stub_server.requests.clear()
+
+
+def test_a_resumed_crawl_fetches_only_the_missing_pages(stub_server, store):
+    projects = catalogue(250)
+    interrupted_crawl(stub_server, store, projects)
+
+    written, removed = sync_full(store)
+
+    # No probe of page 0: the checkpoint already holds it and the query it was fetched with
+    assert [r.query["offset"] for r in stub_server.requests] == ["200", "250"]
+    assert all(r.query[fetch.FOUNDATION_FILTER_PARAM] == fetch.FOUNDATION_ID_CNCF for r in stub_server.requests)
+    assert (written, removed) == (250, 0)
+    assert [r["ID"] for r in store.records()] == [p["ID"] for p in projects]
+
+
+def test_no_resume_discards_the_checkpoint_and_probes_again(stub_server, store):
+    projects = catalogue(250)
+    interrupted_crawl(stub_server, store, projects)
+
+    sync_full(store, no_resume=True)
+
+    assert [r.query["offset"] for r in stub_server.requests] == ["0", "100", "200", "250"]
+
+
+def test_full_sync_is_due_once_the_last_one_is_old_enough(tmp_path):
+    store = ProjectStore(str(tmp_path / "store.sqlite3"))
+    now = calendar.timegm((2026, 10, 17, 12, 0, 0))
+    assert fetch.full_sync_due(store, 7, now)
+
+    store.set_meta("last_full_sync", "2026-10-11T12:00:00Z")
+    assert not fetch.full_sync_due(store, 7, now)
+    assert fetch.full_sync_due(store, 6, now)
+    assert not fetch.full_sync_due(store, 0, now)
+    store.close()
+
+
+def test_a_periodic_full_sync_drops_projects_deleted_upstream(stub_server, tmp_path, monkeypatch):
+    monkeypatch.setenv("LFX_TOKEN", "token")
+    monkeypatch.setattr(fetch, "API_URL", f"{stub_server.url}/projects")
+    monkeypatch.setattr(fetch, "CHECKPOINT_DIR", str(tmp_path / "pages"))
+    monkeypatch.setattr(fetch, "STORE_PATH", str(tmp_path / "store.sqlite3"))
+    monkeypatch.setattr(fetch, "DATASOURCES_DIR", str(tmp_path))
+    monkeypatch.setattr(fetch, "OUTPUT_PATH", str(tmp_path / "pcc_projects.yaml"))
+    projects = catalogue(3)
+    stub_server.handler = paginated(projects)
+    fetch.main(["--rate", "0"])
+
+    def stored_ids():
+        store = ProjectStore(fetch.STORE_PATH)
+        try:
+            return [r["ID"] for r in store.records()]
+        finally:
+            store.close()
+
+    # A modified-since sync does not see the deletion
+    del projects[1]
+    fetch.main(["--rate", "0"])
+    assert stored_ids() == ["p0000", "p0001", "p0002"]
+    assert fetch.MODIFIED_SINCE_PARAM in stub_server.requests[-1].query
+
+    store = ProjectStore(fetch.STORE_PATH)
+    store.set_meta("last_full_sync", "2026-01-01T00:00:00Z")
+    store.commit()
+    store.close()
+    fetch.main(["--rate", "0"])
+    assert stored_ids() == ["p0000", "p0002"]
+    assert fetch.MODIFIED_SINCE_PARAM not in stub_server.requests[-1].query
+
+
+def test_pushdown_ignored_by_the_api_is_filtered_client_side(stub_server, store, capsys):
+    projects = catalogue(150)
+    # Every third project belongs to another foundation, and records carry unrequested fields
+    for i, p in enumerate(projects):
+        p["Description"] = "x" * 100
+        if i % 3 == 0:
+            p["Foundation"] = {"ID": "other-foundation", "Name": "Other"}
+    stub_server.handler = paginated(projects)
+
+    written, removed = sync_full(store)
+
+    # The parameters were sent, the API just did not apply them
+    assert stub_server.requests[0].query[fetch.FOUNDATION_FILTER_PARAM] == fetch.FOUNDATION_ID_CNCF
+    assert fetch.FIELDS_PARAM in stub_server.requests[0].query
+    assert "Server-side filtering ignored by the API (66 of 100 projects kept)" in capsys.readouterr().err
+    expected = [fetch.slim_project(p) for p in projects if p["Foundation"]["ID"] == fetch.FOUNDATION_ID_CNCF]
+    assert (written, removed) == (len(expected), 0)
+    assert store.records() == expected
+
+
+def test_pushdown_applied_by_the_api_is_reported(stub_server, store, capsys):
+    stub_server.handler = paginated(catalogue(50))
+
+    sync_full(store)
+
+    assert "Server-side filtering active" in capsys.readouterr().err
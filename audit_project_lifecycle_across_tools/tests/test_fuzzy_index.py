@@ -0,0 +1,91 @@
+import pytest
+
+import audit_landscape_status as audit
+import fuzzy_index
+from alias_index import AliasIndex
+from fuzzy_index import MAX_CANDIDATES, FuzzyIndex
+
+
+def fuzzy_rows(maps, expected, min_score=audit.FUZZY_MIN_SCORE):
+    rows, _, _ = audit.resolve_rows(expected, maps)
+    index = AliasIndex.build(maps)
+    rows, _ = audit.fuzzy_fill(rows, lambda: FuzzyIndex.build(index, skip_prefix=audit.REPO_KEY_PREFIX), min_score)
+    return {row.name: row for row in rows}
+
+
+def test_only_a_bounded_number_of_candidates_is_scored(monkeypatch):
+    keys = [f"operator-{i:03d}" for i in range(300)]
+    index = FuzzyIndex.build(AliasIndex.build({"a": {k: "sandbox" for k in keys}, "b": {"operator-150": "sandbox"}}))
+    scored = []
+    dice = fuzzy_index.dice
+
+    def counting_dice(a, b):
+        scored.append(b)
+        return dice(a, b)
+
+    monkeypatch.setattr(fuzzy_index, "dice", counting_dice)
+
+    best = index.best_matches("operator-150", ["a", "b"], 0.5)
+
+    # Keys are scored once even when both sources know them
+    assert len(scored) <= MAX_CANDIDATES
+    assert best == {"a": ("operator-150", 1.0), "b": ("operator-150", 1.0)}
+
+
+def test_trigrams_shared_by_too_many_keys_select_no_candidates(monkeypatch):
+    monkeypatch.setattr(fuzzy_index, "MAX_POSTING", 4)
+    keys = [f"xyz{i}" for i in range(10)]
+    index = FuzzyIndex.build(AliasIndex.build({"a": {k: "sandbox" for k in keys}}))
+
+    # Only the trigrams of "xyz" are shared, and by all ten keys
+    assert index.best_matches("xyzq", ["a"], 0.0) == {}
+    assert index.best_matches("xyz7", ["a"], 0.5) == {"a": ("xyz7", 1.0)}
+
+
+def test_repository_keys_are_not_indexed():
+    index = FuzzyIndex.build(
+        AliasIndex.build({"a": {"repo:containerd/containerd": "graduated", "containerd": "graduated"}}),
+        skip_prefix=audit.REPO_KEY_PREFIX,
+    )
+
+    assert len(index) == 1
+    assert index.best_matches("repo:containerd/containerd", ["a"], 0.9) == {}
+
+
+@pytest.mark.parametrize(
+    "name, key, status",
+    [
+        # Dice 0.69: a different project sharing a prefix
+        ("container2wasm", "", ""),
+        # Dice 0.71
+        ("metal3-io", "metal3", "incubating"),
+    ],
+)
+def test_fuzzy_matches_need_the_minimum_score(name, key, status):
+    maps = {"landscape": {"containerd": "graduated", "metal3": "incubating"}}
+
+    row = fuzzy_rows(maps, [(name, "sandbox", "")])[name]
+
+    assert row.statuses == {"landscape": status}
+    assert row.matched == {"landscape": key}
+    if key:
+        assert row.fuzzy["landscape"] == pytest.approx(0.706, abs=0.001)
+        assert "fuzzy:landscape" in row.reasons
+    else:
+        assert row.fuzzy == {}
+        assert "missing:landscape" in row.reasons
+
+
+def test_a_fuzzy_match_never_overrides_an_exact_match():
+    maps = {
+        # "metal3-io" is an exact key here, and "metal3" a close one
+        "landscape": {"metal3-io": "sandbox", "metal3": "incubating"},
+        "clomonitor": {"metal3": "incubating"},
+    }
+
+    row = fuzzy_rows(maps, [("metal3-io", "sandbox", "")], min_score=0.0)["metal3-io"]
+
+    assert row.statuses == {"landscape": "sandbox", "clomonitor": "incubating"}
+    assert row.matched == {"landscape": "metal3-io", "clomonitor": "metal3"}
+    # Only the source without an exact match was filled fuzzily
+    assert set(row.fuzzy) == {"clomonitor"}
@@ -0,0 +1,52 @@
+import pytest
+
+import audit_landscape_status as audit
+
+REPORTS = ("status_audit.md", "all_statuses.md", "all_statuses.jsonl")
+
+
+@pytest.fixture
+def datasources(tmp_path, monkeypatch, recorded_text):
+    """
+    A datasources/ directory holding the recorded snapshots.
+    """
+    datasources = tmp_path / "datasources"
+    datasources.mkdir()
+    for source in audit.registered_sources():
+        (datasources / source.filename).write_text(recorded_text(source.name), encoding="utf-8")
+    (datasources / "pcc_projects.yaml").write_text(recorded_text("pcc"), encoding="utf-8")
+    monkeypatch.setattr(audit, "DATASOURCES_DIR", str(datasources))
+    monkeypatch.setattr(audit, "PCC_YAML_PATH", str(datasources / "pcc_projects.yaml"))
+    monkeypatch.setattr(audit, "AUDIT_STATE_PATH", str(tmp_path / "audit_state.pickle"))
+    return datasources
+
+
+def run(monkeypatch, out_dir, *args):
+    monkeypatch.setattr(audit, "AUDIT_OUTPUT_PATH", str(out_dir / "status_audit.md"))
+    monkeypatch.setattr(audit, "ALL_AUDIT_OUTPUT_PATH", str(out_dir / "all_statuses.md"))
+    monkeypatch.setattr(audit, "PARSE_CACHE_DIR", str(out_dir.parent / "parsed"))
+    audit.main(["--offline", *args])
+    return {name: (out_dir / name).read_text(encoding="utf-8") for name in REPORTS}
+
+
+def test_an_incremental_run_writes_the_same_reports_as_a_full_run(datasources, tmp_path, monkeypatch, capsys):
+    before = run(monkeypatch, tmp_path / "incremental", "--incremental")
+    assert "Incremental: resolved" in capsys.readouterr().err
+
+    # Move one landscape project to another maturity level
+    landscape = datasources / audit.SOURCE_REGISTRY["landscape"].filename
+    text = landscape.read_text(encoding="utf-8")
+    assert "            name: Akri\n" in text
+    head, sep, tail = text.partition("            name: Akri\n")
+    landscape.write_text(head + sep + tail.replace("project: sandbox", "project: incubating", 1), encoding="utf-8")
+
+    incremental = run(monkeypatch, tmp_path / "incremental", "--incremental")
+    err = capsys.readouterr().err
+    resolved, total = err.split("Incremental: resolved ")[1].split(" projects")[0].split(" of ")
+    # Only the projects matching changed landscape keys were resolved again
+    assert 0 < int(resolved) < int(total)
+
+    full = run(monkeypatch, tmp_path / "full", "--no-cache")
+
+    assert incremental != before
+    assert incremental == full
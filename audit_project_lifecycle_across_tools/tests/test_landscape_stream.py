@@ -0,0 +1,78 @@
+import pytest
+import yaml
+
+import audit_landscape_status as audit
+import landscape_stream
+from landscape_stream import iter_landscape_items
+
+LOADERS = [pytest.param(yaml.SafeLoader, id="python")]
+if hasattr(yaml, "CSafeLoader"):
+    LOADERS.append(pytest.param(yaml.CSafeLoader, id="libyaml"))
+
+DOCUMENT = """
+landscape:
+  - category: Provisioning
+    subcategories:
+      - subcategory: Automation
+        items:
+          - item:
+            name: Example
+            project: sandbox
+            repo_url: https://github.com/example/example
+            description: &desc {nested: [1, 2, {deep: true}]}
+            extra:
+              lfx_slug: example
+              annotations: {a: b}
+          - name: ~
+            project: graduated
+          - just a string
+          - name: Other
+            project: null
+      - subcategory: Empty
+        items: []
+  - category: No subcategories
+"""
+
+
+def document_items(text):
+    return list(audit.iter_landscape_document_items(yaml.load(text, Loader=yaml.SafeLoader)))
+
+
+@pytest.mark.parametrize("loader", LOADERS)
+def test_streamed_items_hold_the_fields_the_audit_reads(monkeypatch, loader):
+    monkeypatch.setattr(landscape_stream, "YAML_LOADER", loader)
+
+    items = list(iter_landscape_items(DOCUMENT))
+
+    assert items == [
+        {
+            "name": "Example",
+            "project": "sandbox",
+            "repo_url": "https://github.com/example/example",
+            "extra": {"lfx_slug": "example"},
+        },
+        {"name": None, "project": "graduated"},
+        {"name": "Other", "project": None},
+    ]
+
+
+@pytest.mark.parametrize("loader", LOADERS)
+def test_streaming_matches_a_full_load_on_the_recorded_snapshot(monkeypatch, recorded_text, loader):
+    text = recorded_text("landscape")
+    monkeypatch.setattr(landscape_stream, "YAML_LOADER", loader)
+
+    streamed = audit.build_landscape_status_map_from_items(iter_landscape_items(text))
+    full = audit.build_landscape_status_map(yaml.load(text, Loader=loader))
+
+    # Same keys, same statuses and same insertion order
+    assert list(streamed.items()) == list(full.items())
+
+
+def test_the_audit_streams_only_with_libyaml(monkeypatch):
+    monkeypatch.setattr(audit, "iter_landscape_items", lambda text: iter(["streamed"]))
+
+    monkeypatch.setattr(audit, "YAML_LOADER", yaml.SafeLoader)
+    assert list(audit.parse_landscape_items(DOCUMENT)) == document_items(DOCUMENT)
+
+    monkeypatch.setattr(audit, "YAML_LOADER", object())
+    assert list(audit.parse_landscape_items(DOCUMENT)) == ["streamed"]
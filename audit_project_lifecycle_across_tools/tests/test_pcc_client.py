@@ -0,0 +1,236 @@
+import json
+
+import pytest
+import requests
+
+import pcc_client
+from pcc_client import build_session, crawl_pages, decode_page, get_page, iter_json_members, page_items, probe_query
+
+PAGE_SIZE = 100
+
+
+def catalogue(n):
+    return [{"ID": f"p{i:04d}", "Name": f"Project {i}"} for i in range(n)]
+
+
+def paginated(projects, total=None, max_limit=None):
+    """
+    A handler serving `projects` by offset/limit, reporting `total` as
+    Metadata.TotalSize (len(projects) by default; pass False to omit it).
+    """
+    def handler(request):
+        offset = int(request.query.get("offset", 0))
+        limit = int(request.query.get("limit", PAGE_SIZE))
+        if max_limit:
+            limit = min(limit, max_limit)
+        body = {"Data": projects[offset:offset + limit], "Metadata": {"Offset": offset}}
+        if total is not False:
+            body["Metadata"]["TotalSize"] = len(projects) if total is None else total
+        return 200, {"Content-Type": "application/json"}, json.dumps(body).encode("utf-8")
+
+    return handler
+
+
+def crawl(stub, **kwargs):
+    with build_session({}, 4) as session:
+        pages = crawl_pages(session, f"{stub.url}/projects", PAGE_SIZE, **kwargs)
+    return [item["ID"] for _, page in pages for item in page_items(page)]
+
+
+def api_response():
+    """
+    A page shaped like a PCC API response, with numbers, literals and
+    escapes that can be split at any character.
+    """
+    projects = [
+        {
+            "ID": "a0941000002wBz4AAE",
+            "Name": "Kubernetes \u00e9 \"k8s\"",
+            "Category": "Graduated",
+            "Status": "Active",
+            "Score": 1.5,
+            "Weight": 1e5,
+            "Delta": -3,
+            "Ratio": -2.5e-3,
+            "Big": 12345678901234567890,
+            "Verified": True,
+            "ProjectLogo": None,
+            "Foundation": {"ID": "a0941000002wBz4AAE", "Tags": [0, 10, -0.0]},
+        },
+        {"ID": "p0001", "Name": "Envoy", "Status": "Forming", "Score": 0, "Weight": 2.0E+2},
+    ]
+    return {"Data": projects, "Metadata": {"Offset": 0, "PageSize": 100, "TotalSize": 2, "Elapsed": 0.25}}
+
+
+def offsets(stub):
+    return [int(r.query["offset"]) for r in stub.requests]
+
+
+def test_pages_below_the_reported_total_are_all_fetched_in_order(stub_server):
+    projects = catalogue(250)
+    stub_server.handler = paginated(projects)
+
+    ids = crawl(stub_server, concurrency=4)
+
+    assert ids == [p["ID"] for p in projects]
+    assert offsets(stub_server)[0] == 0
+    # Pages 100 and 200 concurrently, then the empty page after the last project
+    assert sorted(offsets(stub_server)[1:3]) == [100, 200]
+    assert offsets(stub_server)[3:] == [250]
+
+
+def test_without_a_total_pages_are_walked_until_an_empty_one(stub_server):
+    projects = catalogue(230)
+    stub_server.handler = paginated(projects, total=False)
+
+    ids = crawl(stub_server)
+
+    assert ids == [p["ID"] for p in projects]
+    assert offsets(stub_server) == [0, 100, 200, 230]
+
+
+def test_projects_added_past_a_stale_total_are_picked_up(stub_server):
+    projects = catalogue(180)
+    stub_server.handler = paginated(projects, total=100)
+
+    ids = crawl(stub_server)
+
+    assert len(ids) == 180
+    assert offsets(stub_server) == [0, 100, 180]
+
+
+def test_steps_by_the_page_size_the_server_returns(stub_server):
+    projects = catalogue(120)
+    stub_server.handler = paginated(projects, max_limit=50)
+
+    ids = crawl(stub_server)
+
+    assert ids == [p["ID"] for p in projects]
+    assert sorted(offsets(stub_server)) == [0, 50, 100, 120]
+
+
+def test_pagination_counts_projects_dropped_by_keep(stub_server):
+    projects = catalogue(150)
+    stub_server.handler = paginated(projects)
+
+    ids = crawl(stub_server, keep=lambda p: p if p["ID"].endswith("0") else None)
+
+    assert ids == [p["ID"] for p in projects if p["ID"].endswith("0")]
+    assert sorted(offsets(stub_server)) == [0, 100, 150]
+
+
+@pytest.mark.parametrize("status", [429, 500, 502, 503, 504])
+def test_retryable_statuses_back_off_and_retry(stub_server, sleeps, status):
+    serve = paginated(catalogue(150))
+    failures = {100: 2}
+
+    def handler(request):
+        offset = int(request.query["offset"])
+        if failures.get(offset):
+            failures[offset] -= 1
+            return status, {}, b""
+        return serve(request)
+
+    stub_server.handler = handler
+
+    ids = crawl(stub_server)
+
+    assert len(ids) == 150
+    assert offsets(stub_server) == [0, 100, 100, 100, 150]
+    assert sleeps == [pcc_client.DEFAULT_BACKOFF_SECONDS, pcc_client.DEFAULT_BACKOFF_SECONDS * 2]
+
+
+def test_gives_up_after_the_last_retry(stub_server, sleeps):
+    stub_server.sequence((503, {}, b""))
+
+    with pytest.raises(requests.HTTPError):
+        crawl(stub_server)
+
+    assert len(stub_server.requests) == pcc_client.DEFAULT_RETRIES + 1
+
+
+def test_other_http_errors_are_not_retried(stub_server, sleeps):
+    stub_server.sequence((404, {}, b""))
+
+    with pytest.raises(requests.HTTPError):
+        crawl(stub_server)
+
+    assert len(stub_server.requests) == 1
+    assert sleeps == []
+
+
+@pytest.mark.parametrize(
+    "chunks",
+    [
+        ['{"Data": [], "T": 1', ".", "5}"],
+        ['{"Data": [], "T": 1', "e5}"],
+        ['{"Data": [], "T": -', "2", ".", "5", "E", "-", "3}"],
+        ['{"Data": [], "T": 2', "}"],
+    ],
+)
+def test_a_number_split_across_chunks_is_decoded_whole(chunks):
+    expected = json.loads("".join(chunks))
+
+    assert list(iter_json_members(chunks, "Data")) == [("T", expected["T"])]
+
+
+def test_a_page_streamed_one_character_at_a_time_decodes_like_json_loads():
+    text = json.dumps(api_response())
+
+    page = decode_page(iter(text))
+
+    expected = json.loads(text)
+    assert page == {**expected, "RawCount": len(expected["Data"])}
+
+
+def test_a_page_streamed_one_byte_at_a_time_over_http_decodes_like_json_loads(stub_server, monkeypatch):
+    monkeypatch.setattr(pcc_client, "STREAM_CHUNK_BYTES", 1)
+    body = json.dumps(api_response(), ensure_ascii=False).encode("utf-8")
+    stub_server.sequence((200, {"Content-Type": "application/json; charset=utf-8"}, body))
+
+    with build_session({}, 1) as session:
+        page = get_page(session, f"{stub_server.url}/projects", {"offset": 0})
+
+    expected = json.loads(body)
+    assert page["Data"] == expected["Data"]
+    assert page["Metadata"] == expected["Metadata"]
+    assert page["RawCount"] == len(expected["Data"])
+
+
+@pytest.mark.parametrize("status", sorted(pcc_client.UNSUPPORTED_QUERY_STATUS_CODES))
+def test_rejected_pushdown_parameters_fall_back_to_a_plain_crawl(stub_server, sleeps, status):
+    projects = catalogue(150)
+    serve = paginated(projects)
+
+    def handler(request):
+        if "foundationId" in request.query or "fields" in request.query:
+            return status, {}, b'{"Message": "unknown parameter"}'
+        return serve(request)
+
+    stub_server.handler = handler
+    pushdown = {"foundationId": "cncf", "fields": "ID,Name"}
+
+    with build_session({}, 1) as session:
+        params, first_page = probe_query(session, f"{stub_server.url}/projects", PAGE_SIZE, pushdown)
+    assert (params, first_page) == ({}, None)
+    # The rejection is not retried
+    assert len(stub_server.requests) == 1 and sleeps == []
+
+    stub_server.requests.clear()
+    ids = crawl(stub_server, extra_params=params)
+
+    assert ids == [p["ID"] for p in projects]
+    assert not any("foundationId" in r.query or "fields" in r.query for r in stub_server.requests)
+
+
+def test_accepted_pushdown_parameters_are_kept_for_the_crawl(stub_server):
+    stub_server.handler = paginated(catalogue(150))
+    pushdown = {"foundationId": "cncf", "fields": "ID,Name"}
+
+    with build_session({}, 1) as session:
+        params, first_page = probe_query(session, f"{stub_server.url}/projects", PAGE_SIZE, pushdown)
+
+    assert params == pushdown
+    assert page_items(first_page) == catalogue(150)[:PAGE_SIZE]
+    assert stub_server.requests[0].query["foundationId"] == "cncf"
+    assert stub_server.requests[0].query["fields"] == "ID,Name"
@@ -0,0 +1,21 @@
+from pcc_store import ProjectStore
+
+
+def test_records_without_a_key_are_skipped_with_a_warning(tmp_path, capsys):
+    store = ProjectStore(str(tmp_path / "store.sqlite3"))
+
+    written = store.upsert([{"ID": "a"}, {"Slug": "b"}, {"Name": "C"}, {"Status": "Active"}, {"ID": None, "Name": ""}])
+
+    assert written == 3
+    assert [r.get("ID") or r.get("Slug") or r.get("Name") for r in store.records()] == ["a", "b", "C"]
+    assert "skipped 2 PCC records with no ID, slug or name" in capsys.readouterr().err
+    store.close()
+
+
+def test_retain_ignores_empty_keys(tmp_path):
+    store = ProjectStore(str(tmp_path / "store.sqlite3"))
+    store.upsert([{"ID": "a"}, {"ID": "b"}])
+
+    assert store.retain(["b", "", "a"]) == 0
+    assert [r["ID"] for r in store.records()] == ["b", "a"]
+    store.close()
@@ -0,0 +1,70 @@
+from alias_index import AliasIndex
+import audit_landscape_status as audit
+
+
+def landscape_map(*items):
+    """
+    The landscape status map of (name, project status, repo_url) items.
+    """
+    return audit.build_landscape_status_map_from_items(
+        {"name": name, "project": status, "repo_url": repo_url} for name, status, repo_url in items
+    )
+
+
+def resolve(status_map, name, repo_url):
+    return audit.resolve_project(name, AliasIndex.build({"landscape": status_map}), repo_url)
+
+
+def test_repo_query_key_is_the_most_specific_key():
+    assert audit.repo_query_key("https://github.com/acme/widget.git") == ("repo:acme/widget",)
+    assert audit.repo_query_key("https://github.com/acme/") == ("repo:acme",)
+    assert audit.repo_query_key("https://gitlab.com/acme/widget") == ()
+    assert audit.repo_query_key("") == ()
+
+
+def test_an_org_key_shared_by_two_projects_is_dropped_as_ambiguous():
+    status_map = landscape_map(
+        ("Widget", "sandbox", "https://github.com/acme/widget"),
+        ("Gadget", "incubating", "https://github.com/acme/gadget"),
+        ("Solo", "graduated", "https://github.com/solo-org/solo"),
+    )
+
+    assert status_map["repo:acme/widget"] == "sandbox"
+    assert status_map["repo:acme/gadget"] == "incubating"
+    assert "repo:acme" not in status_map
+    # An org used by a single project keeps its key
+    assert status_map["repo:solo-org"] == "graduated"
+
+
+def test_a_repo_url_never_falls_back_to_the_org_key():
+    status_map = landscape_map(("Widget", "sandbox", "https://github.com/vendor/widget"))
+    assert status_map["repo:vendor"] == "sandbox"
+
+    # Another repository of the same vendor org is a different project
+    resolved = resolve(status_map, "Unrelated Tool", "https://github.com/vendor/unrelated-tool")
+    assert resolved.repo_key == ("repo:vendor/unrelated-tool",)
+    assert resolved.statuses == {"landscape": ""}
+    assert resolved.matched == {"landscape": ""}
+
+    # An org URL is joined on the org key
+    resolved = resolve(status_map, "Vendor", "https://github.com/vendor")
+    assert resolved.statuses == {"landscape": "sandbox"}
+    assert resolved.matched == {"landscape": "repo:vendor"}
+
+
+def test_the_repo_key_wins_over_a_conflicting_alias():
+    status_map = landscape_map(
+        ("Widget", "sandbox", "https://github.com/acme/widget"),
+        ("Gadget", "graduated", "https://github.com/other/gadget"),
+    )
+
+    # Named like one landscape project, hosted in another's repository
+    resolved = resolve(status_map, "Gadget", "https://github.com/acme/widget")
+
+    assert resolved.statuses == {"landscape": "sandbox"}
+    assert resolved.matched == {"landscape": "repo:acme/widget"}
+    # The name aliases are not generated once every source matched the repository
+    assert resolved.query_keys == ("repo:acme/widget",)
+
+    # Without a repository URL the name decides
+    assert resolve(status_map, "Gadget", "").statuses == {"landscape": "graduated"}
@@ -0,0 +1,99 @@
+import os
+
+import pytest
+
+import audit_landscape_status as audit
+from report_writer import AtomicReport, atomic_path
+
+
+def write(path, text):
+    with AtomicReport(str(path)) as out:
+        out.write(text)
+    return out
+
+
+def leftovers(directory):
+    return [name for name in os.listdir(directory) if name.startswith(".")]
+
+
+def test_unchanged_content_leaves_the_file_untouched(tmp_path):
+    path = tmp_path / "report.md"
+    assert write(path, "# Report\n").changed
+    os.utime(path, (1_000_000_000, 1_000_000_000))
+
+    assert not write(path, "# Report\n").changed
+    assert path.stat().st_mtime == 1_000_000_000
+
+    assert write(path, "# Report v2\n").changed
+    assert path.read_text(encoding="utf-8") == "# Report v2\n"
+    assert path.stat().st_mtime != 1_000_000_000
+    assert leftovers(tmp_path) == []
+
+
+def test_the_original_survives_an_exception_in_the_block(tmp_path):
+    path = tmp_path / "report.md"
+    write(path, "complete\n")
+
+    with pytest.raises(RuntimeError):
+        with AtomicReport(str(path)) as out:
+            out.write("trunc")
+            raise RuntimeError("failed half way")
+
+    assert path.read_text(encoding="utf-8") == "complete\n"
+    assert not out.changed
+    assert leftovers(tmp_path) == []
+
+
+def test_the_file_mode_is_preserved(tmp_path):
+    path = tmp_path / "report.md"
+    write(path, "v1\n")
+    # A new report is world-readable, not mkstemp's owner-only mode
+    assert path.stat().st_mode & 0o777 == 0o644
+
+    path.chmod(0o600)
+    write(path, "v2\n")
+
+    assert path.stat().st_mode & 0o777 == 0o600
+
+
+def test_atomic_path_replaces_the_file_only_on_success(tmp_path):
+    path = tmp_path / "records.parquet"
+    path.write_bytes(b"old")
+    path.chmod(0o640)
+
+    with pytest.raises(RuntimeError):
+        with atomic_path(str(path)) as tmp:
+            with open(tmp, "wb") as f:
+                f.write(b"partial")
+            raise RuntimeError("writer failed")
+    assert path.read_bytes() == b"old"
+
+    with atomic_path(str(path)) as tmp:
+        with open(tmp, "wb") as f:
+            f.write(b"new")
+    assert path.read_bytes() == b"new"
+    assert path.stat().st_mode & 0o777 == 0o640
+    assert leftovers(tmp_path) == []
+
+
+def test_parquet_records_are_written_atomically(tmp_path, monkeypatch):
+    pq = pytest.importorskip("pyarrow.parquet")
+    target = audit.default_target()._replace(all_path=str(tmp_path / "all_statuses.md"))
+    row = audit.AuditRow("Akri", "sandbox", {"landscape": "sandbox"}, {"landscape": "akri"}, {}, 0, ())
+    sources = [audit.SOURCE_REGISTRY["landscape"]]
+    classified = audit.classify_rows([row])
+
+    audit.write_audit_records(classified, sources, target, parquet=True)
+    assert pq.read_table(target.parquet_path).column("project").to_pylist() == ["Akri"]
+
+    def fail(table, where):
+        with open(where, "wb") as f:
+            f.write(b"PAR1 truncated")
+        raise OSError("disk full")
+
+    monkeypatch.setattr(audit.pyarrow.parquet, "write_table", fail)
+    with pytest.raises(OSError):
+        audit.write_audit_records(classified, sources, target, parquet=True)
+
+    assert pq.read_table(target.parquet_path).column("project").to_pylist() == ["Akri"]
+    assert leftovers(tmp_path) == []
@@ -0,0 +1,117 @@
+import os
+
+import pytest
+
+import audit_landscape_status as audit
+import snapshot_store
+from snapshot_store import MAX_DELTA_DEPTH, SnapshotStore
+from source_fetch import sha256_text
+
+
+def version(n):
+    """
+    A landscape-sized text where version n changes one line of version n - 1.
+    """
+    lines = [f"- name: project-{i}\n  homepage_url: https://example.org/{i}\n" for i in range(300)]
+    for i in range(1, n + 1):
+        lines[i * 7 % len(lines)] = f"- name: project-{i * 7 % len(lines)}\n  project: v{i}\n"
+    return "".join(lines)
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SnapshotStore(str(tmp_path / "store"))
+
+
+def test_versions_round_trip_through_a_delta_chain(store):
+    shas = []
+    for n in range(5):
+        shas.append(store.put(version(n), shas[-1] if shas else ""))
+
+    assert [store.header(sha).depth for sha in shas] == [0, 1, 2, 3, 4]
+    assert store.header(shas[3]).base == shas[2]
+    # A delta is only kept when it is smaller than the full object
+    assert os.path.getsize(store.object_path(shas[4])) < os.path.getsize(store.object_path(shas[0]))
+    assert [store.get(sha) for sha in shas] == [version(n) for n in range(5)]
+    assert shas == [sha256_text(version(n)) for n in range(5)]
+
+
+def test_a_full_copy_is_stored_once_the_chain_reaches_max_depth(store):
+    sha = ""
+    depths = []
+    for n in range(MAX_DELTA_DEPTH + 3):
+        sha = store.put(version(n), sha)
+        depths.append(store.header(sha).depth)
+
+    assert depths == list(range(MAX_DELTA_DEPTH + 1)) + [0, 1]
+    assert store.header(sha).base
+    assert store.get(sha) == version(MAX_DELTA_DEPTH + 2)
+
+
+def test_record_skips_a_run_when_nothing_changed(store):
+    files = {"landscape": ("landscape.yml", version(0)), "pcc": ("pcc_projects.yaml", "categories: {}\n")}
+
+    first = store.record(files)
+    assert first.number == 1
+
+    assert store.record(files) is None
+    assert store.runs() == [1]
+
+    second = store.record({**files, "landscape": ("landscape.yml", version(1))})
+    assert second.number == 2
+    assert store.runs() == [1, 2]
+    assert second.entries["pcc"] == first.entries["pcc"]
+    # The changed snapshot is stored against its version in the previous run
+    assert store.header(second.entries["landscape"]["sha256"]).base == first.entries["landscape"]["sha256"]
+
+
+def test_checkout_restores_an_earlier_run(store, tmp_path, capsys):
+    store.record({"landscape": ("landscape.yml", version(0))})
+    store.record({"landscape": ("landscape.yml", version(1))})
+    dest = tmp_path / "datasources"
+    dest.mkdir()
+
+    snapshot_store.main(["--store", store.root, "checkout", "1", "--dest", str(dest)])
+    assert (dest / "landscape.yml").read_text(encoding="utf-8") == version(0)
+
+    # Files already holding the run's content are left untouched
+    assert store.checkout(1, str(dest)) == []
+    assert store.checkout(2, str(dest)) == [str(dest / "landscape.yml")]
+    assert (dest / "landscape.yml").read_text(encoding="utf-8") == version(1)
+    assert "Checked out run 1: 1 files written" in capsys.readouterr().err
+
+
+def test_as_of_run_loads_the_snapshots_of_that_run(store, capsys):
+    source = audit.SOURCE_REGISTRY["landscape"]
+    target = audit.default_target()
+    pcc = audit.run_entry_name(target)
+    store.record({source.name: (source.filename, version(0)), pcc: ("pcc_projects.yaml", "pcc: 1\n")})
+    store.record({source.name: (source.filename, version(1)), pcc: ("pcc_projects.yaml", "pcc: 2\n")})
+
+    pcc_texts, fetched = audit.load_recorded_run(store, 1, [source], [target])
+
+    assert pcc_texts == {target.name: "pcc: 1\n"}
+    assert fetched[source.name].text == version(0)
+    assert fetched[source.name].sha256 == sha256_text(version(0))
+
+    with pytest.raises(SystemExit) as exc:
+        audit.load_recorded_run(store, 3, [source], [target])
+    assert exc.value.code == 1
+    assert "run 3 is not recorded" in capsys.readouterr().err
+
+
+def test_verify_detects_a_corrupted_object(store, capsys):
+    run = store.record({"landscape": ("landscape.yml", version(0))})
+    store.record({"landscape": ("landscape.yml", version(1))})
+    snapshot_store.main(["--store", store.root, "verify"])
+    assert "Verified 2 objects across 2 runs" in capsys.readouterr().err
+
+    # Replace the base object's content; the delta built on it is corrupt too
+    path = store.object_path(run.entries["landscape"]["sha256"])
+    with open(path, "rb") as f:
+        header = f.readline()
+    with open(path, "wb") as f:
+        f.write(header + snapshot_store.compress(snapshot_store.CODEC_XZ, version(5).encode("utf-8")))
+
+    with pytest.raises(ValueError, match="is corrupt"):
+        snapshot_store.main(["--store", store.root, "verify"])
@@ -0,0 +1,174 @@
+import json
+import os
+
+import pytest
+import requests
+
+import source_fetch
+from source_fetch import MODE_LOCAL, MODE_OFFLINE, MODE_REFRESH, FetchSpec, fetch_all, sha256_text
+
+
+def spec_for(stub, tmp_path, name="landscape"):
+    return FetchSpec(name, f"{stub.url}/{name}", str(tmp_path / f"{name}.txt"))
+
+
+def read_manifest(tmp_path):
+    with open(tmp_path / source_fetch.MANIFEST_FILENAME, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_local_mode_fetches_only_missing_snapshots(stub_server, tmp_path):
+    stub_server.sequence((200, {"ETag": '"v1"'}, b"fresh"))
+    present = spec_for(stub_server, tmp_path, "present")
+    missing = spec_for(stub_server, tmp_path, "missing")
+    with open(present.path, "w", encoding="utf-8") as f:
+        f.write("on disk")
+
+    results = fetch_all([present, missing], mode=MODE_LOCAL)
+
+    assert [r.path for r in stub_server.requests] == ["/missing"]
+    assert results["present"].text == "on disk"
+    assert results["missing"].text == "fresh"
+    with open(missing.path, encoding="utf-8") as f:
+        assert f.read() == "fresh"
+    assert read_manifest(tmp_path)["missing"] == {"url": missing.url, "sha256": sha256_text("fresh"), "etag": '"v1"'}
+
+
+@pytest.mark.parametrize("mode", [MODE_LOCAL, MODE_OFFLINE])
+def test_reusing_snapshots_leaves_the_manifest_alone(stub_server, tmp_path, mode):
+    spec = spec_for(stub_server, tmp_path)
+    with open(spec.path, "w", encoding="utf-8") as f:
+        f.write("replaced by hand")
+    manifest_path = tmp_path / source_fetch.MANIFEST_FILENAME
+    manifest_path.write_text('{"landscape": {"sha256": "stale"}}', encoding="utf-8")
+
+    fetch_all([spec], mode=mode)
+
+    assert manifest_path.read_text(encoding="utf-8") == '{"landscape": {"sha256": "stale"}}'
+    assert stub_server.requests == []
+
+
+def test_refresh_revalidates_and_keeps_the_snapshot_on_304(stub_server, tmp_path):
+    def handler(request):
+        if request.headers.get("If-None-Match") == '"v1"':
+            return 304, {}, b""
+        return 200, {"ETag": '"v1"', "Last-Modified": "Tue, 01 Sep 2026 00:00:00 GMT"}, b"body"
+
+    stub_server.handler = handler
+    spec = spec_for(stub_server, tmp_path)
+    fetch_all([spec], mode=MODE_REFRESH)
+    mtime = os.stat(spec.path).st_mtime_ns
+
+    results = fetch_all([spec], mode=MODE_REFRESH)
+
+    second = stub_server.requests[1]
+    assert second.headers["If-None-Match"] == '"v1"'
+    assert second.headers["If-Modified-Since"] == "Tue, 01 Sep 2026 00:00:00 GMT"
+    assert results["landscape"].text == "body"
+    assert os.stat(spec.path).st_mtime_ns == mtime
+
+
+def test_refresh_downloads_a_changed_source(stub_server, tmp_path):
+    stub_server.sequence((200, {"ETag": '"v1"'}, b"old"), (200, {"ETag": '"v2"'}, b"new"))
+    spec = spec_for(stub_server, tmp_path)
+    fetch_all([spec], mode=MODE_REFRESH)
+
+    results = fetch_all([spec], mode=MODE_REFRESH)
+
+    assert results["landscape"].text == "new"
+    assert read_manifest(tmp_path)["landscape"]["etag"] == '"v2"'
+
+
+def test_offline_mode_never_uses_the_network(stub_server, tmp_path):
+    spec = spec_for(stub_server, tmp_path)
+    with pytest.raises(FileNotFoundError):
+        fetch_all([spec], mode=MODE_OFFLINE)
+    with open(spec.path, "w", encoding="utf-8") as f:
+        f.write("on disk")
+
+    assert fetch_all([spec], mode=MODE_OFFLINE)["landscape"].text == "on disk"
+    assert stub_server.requests == []
+
+
+def test_retryable_statuses_back_off_exponentially(stub_server, tmp_path, sleeps):
+    stub_server.sequence((503, {}, b""), (502, {}, b""), (200, {}, b"body"))
+
+    results = fetch_all([spec_for(stub_server, tmp_path)], mode=MODE_LOCAL)
+
+    assert results["landscape"].text == "body"
+    assert len(stub_server.requests) == 3
+    backoff = source_fetch.DEFAULT_BACKOFF_SECONDS
+    assert sleeps == [backoff, backoff * 2]
+
+
+def test_retry_after_is_honoured_before_the_backoff(stub_server, tmp_path, sleeps):
+    stub_server.sequence((429, {"Retry-After": "7"}, b""), (503, {"Retry-After": "bogus"}, b""), (200, {}, b"body"))
+
+    fetch_all([spec_for(stub_server, tmp_path)], mode=MODE_LOCAL)
+
+    # A header that is not a delay falls back to the backoff of that attempt
+    assert sleeps == [7.0, source_fetch.DEFAULT_BACKOFF_SECONDS * 2]
+
+
+def test_retry_after_is_capped(stub_server, tmp_path, sleeps):
+    stub_server.sequence((503, {"Retry-After": "86400"}, b""), (200, {}, b"body"))
+
+    fetch_all([spec_for(stub_server, tmp_path)], mode=MODE_LOCAL)
+
+    assert sleeps == [source_fetch.MAX_RETRY_AFTER_SECONDS]
+
+
+def test_gives_up_after_the_last_retry(stub_server, tmp_path, sleeps):
+    stub_server.sequence((500, {}, b""))
+
+    with pytest.raises(requests.HTTPError):
+        fetch_all([spec_for(stub_server, tmp_path)], mode=MODE_LOCAL)
+
+    assert len(stub_server.requests) == source_fetch.DEFAULT_RETRIES + 1
+
+
+def test_other_http_errors_are_not_retried(stub_server, tmp_path, sleeps):
+    stub_server.sequence((404, {}, b""))
+
+    with pytest.raises(requests.HTTPError):
+        fetch_all([spec_for(stub_server, tmp_path)], mode=MODE_LOCAL)
+
+    assert len(stub_server.requests) == 1
+    assert sleeps == []
+
+
+@pytest.mark.parametrize("mode", [MODE_LOCAL, MODE_OFFLINE])
+def test_missing_snapshots_are_restored_before_fetching(stub_server, tmp_path, mode):
+    spec = spec_for(stub_server, tmp_path)
+
+    results = fetch_all([spec], mode=mode, restore=lambda s: "recorded" if s.name == "landscape" else None)
+
+    assert results["landscape"].text == "recorded"
+    with open(spec.path, encoding="utf-8") as f:
+        assert f.read() == "recorded"
+    assert stub_server.requests == []
+    assert not (tmp_path / source_fetch.MANIFEST_FILENAME).exists()
+
+
+def test_a_snapshot_without_a_recorded_copy_is_fetched(stub_server, tmp_path):
+    stub_server.sequence((200, {}, b"fresh"))
+
+    results = fetch_all([spec_for(stub_server, tmp_path)], mode=MODE_LOCAL, restore=lambda s: None)
+
+    assert results["landscape"].text == "fresh"
+    assert len(stub_server.requests) == 1
+
+
+def test_refresh_revalidates_a_restored_snapshot(stub_server, tmp_path):
+    spec = spec_for(stub_server, tmp_path)
+    manifest_path = tmp_path / source_fetch.MANIFEST_FILENAME
+    manifest_path.write_text(
+        json.dumps({"landscape": {"url": spec.url, "sha256": sha256_text("recorded"), "etag": '"v1"'}}),
+        encoding="utf-8",
+    )
+    stub_server.sequence((304, {}, b""))
+
+    results = fetch_all([spec], mode=MODE_REFRESH, restore=lambda s: "recorded")
+
+    assert results["landscape"].text == "recorded"
+    assert stub_server.requests[0].headers["If-None-Match"] == '"v1"'